@@ -15,8 +15,13 @@ import json
 import math
 import sys
 import os
-from collections import defaultdict, Counter
-from itertools import combinations
+import time
+import glob
+import hashlib
+import heapq
+import tempfile
+from collections import Counter
+from itertools import combinations, compress
 from typing import Dict, List, Tuple, Any
 
 # NetworkX 설치 확인
@@ -27,6 +32,24 @@ except ImportError:
     # NetworkX 없이 기본 그래프 기능으로 대체
     nx = None
 
+# NumPy 설치 확인 (있으면 대용량 공동 등장 집계를 벡터화)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# igraph 설치 확인 (있으면 C 구현으로 커뮤니티 탐지)
+try:
+    import igraph as ig
+except ImportError:
+    ig = None
+
+# orjson 설치 확인 (있으면 결과 JSON 직렬화에 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # requests 설치 확인
 try:
     import requests
@@ -34,39 +57,108 @@ except ImportError:
     print("Requests not installed. Using basic HTTP functionality.", file=sys.stderr)
     requests = None
 
-def extract_meaningful_keywords(reviews: List[Dict]) -> Dict[str, int]:
+# 분석 결과 파일 캐시 유효 시간 (초)
+CACHE_TTL_SECONDS = 3600
+
+# GPT 클러스터 라벨 캐시 파일 경로 및 최대 항목 수 (항목별로 분석 결과 캐시와 같은 유효 시간 적용)
+LABEL_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'kwnet_cluster_labels.json')
+LABEL_CACHE_MAX_ENTRIES = 512
+
+# OpenAI 호출 실패 시 /api/generate-cluster-labels가 대신 돌려주는 기본 라벨 (openai_analysis.ts)
+_PLACEHOLDER_LABEL = '키워드 그룹'
+
+# NumPy 벡터화 공동 등장 집계를 사용할 최소 토큰 수
+VECTORIZE_MIN_TOKENS = 20000
+
+# 한글 2-6자 토큰 추출 패턴 (리뷰마다 재컴파일하지 않도록 모듈 로드 시 한 번만 컴파일)
+_KOREAN_WORD_RE = re.compile(r'[가-힣]{2,6}')
+
+# 완성형 한글로만 이루어진 단어 판별 패턴
+_HANGUL_ONLY_RE = re.compile(r'[가-힣]+')
+
+# 서비스 관련 불용어 (제외할 단어들)
+_STOPWORDS = frozenset({
+    '익시오', '앱', '어플', '애플리케이션', '유플러스', 'LG', 'LGU', 'U+',
+    '사용', '사용자', '좋다', '나쁘다', '괜찮다', '별로', '그냥', '정말',
+    '너무', '조금', '많이', '아주', '가끔', '항상', '때문', '이제', '지금',
+    '이번', '다음', '처음', '마지막', '하지만', '그래서', '그리고', '또한',
+    '수', '있다', '없다', '된다', '한다', '같다', '다르다', '것', '거', '게',
+    '서비스', '기능', '시스템', '개발', '업데이트', '버전', '설정', '화면',
+    '메뉴', '버튼', '클릭', '터치', '선택', '입력', '출력', '실행', '종료'
+})
+
+# 의미있는 키워드 카테고리 (포함하는 방식으로 판별)
+_MEANINGFUL_KEYWORDS = frozenset({
+    # 통화 관련
+    '통화', '전화', '연결', '끊김', '끊어', '수신', '발신', '벨소리',
+    # 기능 관련
+    '기능', '녹음', '음성', '소리', '볼륨', '알림', '메시지', '문자',
+    # 품질 관련
+    '품질', '속도', '느림', '빠름', '안정', '불안', '깨끗', '선명',
+    # 오류 관련
+    '오류', '버그', '문제', '에러', '실패', '작동', '멈춤', '충돌',
+    # 사용성 관련
+    '편리', '불편', '쉬움', '어려', '복잡', '간단', '직관', '사용',
+    # 감정 표현
+    '만족', '불만', '좋음', '나쁨', '훌륭', '최고', '최악', '답답',
+    '스트레스', '도움', '유용', '쓸모', '필요', '개선', '수정',
+    # UI/UX 관련
+    '화면', '버튼', '메뉴', '설정', '디자인', '인터페이스', '레이아웃',
+    # 성능 관련
+    '빠름', '느림', '지연', '반응', '처리', '로딩', '시간', '대기'
+})
+
+# 키워드가 단어에 포함되는지 한 번의 정규식 검색으로 판별 (긴 키워드 우선)
+_MEANINGFUL_RE = re.compile('|'.join(
+    re.escape(keyword) for keyword in sorted(_MEANINGFUL_KEYWORDS, key=len, reverse=True)
+))
+
+# 단어가 키워드에 포함되는지 판별하기 위한 키워드의 2자 이상 부분 문자열 집합 (키워드 자체 포함)
+_MEANINGFUL_SUBSTRINGS = frozenset(
+    keyword[i:j]
+    for keyword in _MEANINGFUL_KEYWORDS
+    for i in range(len(keyword))
+    for j in range(i + 2, len(keyword) + 1)
+)
+
+# 클러스터 라벨 축약용 카테고리 (순서대로 검사)
+_CLEAN_LABEL_BUCKETS = [
+    (re.compile('통화|전화|연결'), '통화 품질'),
+    (re.compile('화면|버튼|설정'), 'UI/UX 개선'),
+    (re.compile('오류|문제|버그'), '기능 안정성'),
+    (re.compile('편리|불편|사용'), '사용성 개선'),
+]
+
+# 대표 키워드 기반 fallback 라벨 카테고리 (순서대로 검사)
+_FALLBACK_LABEL_BUCKETS = [
+    (re.compile('통화|전화|연결|수신|발신'), '통화 기능'),
+    (re.compile('화면|버튼|메뉴|설정'), 'UI 요소'),
+    (re.compile('오류|문제|버그|실패'), '안정성 문제'),
+    (re.compile('음성|소리|녹음|볼륨'), '음성 품질'),
+    (re.compile('편리|불편|사용|조작'), '사용성'),
+]
+
+def tokenize_reviews(reviews: List[Dict]) -> List[List[str]]:
+    """
+    리뷰별 한글 토큰 목록 생성 (키워드 추출과 공동 등장 분석에서 함께 재사용)
+    """
+    return [_KOREAN_WORD_RE.findall(review.get('content', '')) for review in reviews]
+
+def extract_meaningful_keywords(tokenized_reviews: List[List[str]]) -> Dict[str, int]:
     """
-    리뷰에서 의미있는 키워드를 추출하고 빈도를 계산
+    토큰화된 리뷰에서 의미있는 키워드를 추출하고 빈도를 계산
     """
     # 한국어 형태소 분석 대신 정규식 기반 키워드 추출
     keyword_freq = Counter()
     
-    # 서비스 관련 불용어 (제외할 단어들)
-    stopwords = {
-        '익시오', '앱', '어플', '애플리케이션', '유플러스', 'LG', 'LGU', 'U+',
-        '사용', '사용자', '좋다', '나쁘다', '괜찮다', '별로', '그냥', '정말',
-        '너무', '조금', '많이', '아주', '가끔', '항상', '때문', '이제', '지금',
-        '이번', '다음', '처음', '마지막', '하지만', '그래서', '그리고', '또한',
-        '수', '있다', '없다', '된다', '한다', '같다', '다르다', '것', '거', '게',
-        '서비스', '기능', '시스템', '개발', '업데이트', '버전', '설정', '화면',
-        '메뉴', '버튼', '클릭', '터치', '선택', '입력', '출력', '실행', '종료'
-    }
-    
-    for review in reviews:
-        content = review.get('content', '')
-        
-        # 한글 명사 추출 (2-6자)
-        korean_words = re.findall(r'[가-힣]{2,6}', content)
-        
+    for korean_words in tokenized_reviews:
         # 의미있는 키워드 필터링
-        for word in korean_words:
-            # 불용어 제거
-            if word in stopwords:
-                continue
-                
-            # 의미있는 키워드 판별 (기술적 용어, 감정 표현, 기능 관련)
-            if is_meaningful_keyword(word):
-                keyword_freq[word] += 1
+        # (토큰은 _KOREAN_WORD_RE로 추출된 2-6자 한글이므로 is_meaningful_keyword의 한글 판별을 항상 통과함)
+        # 불용어 제거 및 의미있는 키워드 판별 (기술적 용어, 감정 표현, 기능 관련) 후 빈도 집계
+        keyword_freq.update(
+            word for word in korean_words
+            if word not in _STOPWORDS and is_meaningful_keyword(word)
+        )
     
     # 최소 빈도 1 이상인 키워드만 선택 (더 관대하게)
     return {k: v for k, v in keyword_freq.items() if v >= 1}
@@ -83,80 +175,118 @@ def is_meaningful_keyword(word: str) -> bool:
     if word.isdigit():
         return False
     
-    # 의미있는 키워드 카테고리 (포함하는 방식으로 변경)
-    meaningful_keywords = {
-        # 통화 관련
-        '통화', '전화', '연결', '끊김', '끊어', '수신', '발신', '벨소리',
-        # 기능 관련
-        '기능', '녹음', '음성', '소리', '볼륨', '알림', '메시지', '문자',
-        # 품질 관련
-        '품질', '속도', '느림', '빠름', '안정', '불안', '깨끗', '선명',
-        # 오류 관련
-        '오류', '버그', '문제', '에러', '실패', '작동', '멈춤', '충돌',
-        # 사용성 관련
-        '편리', '불편', '쉬움', '어려', '복잡', '간단', '직관', '사용',
-        # 감정 표현
-        '만족', '불만', '좋음', '나쁨', '훌륭', '최고', '최악', '답답',
-        '스트레스', '도움', '유용', '쓸모', '필요', '개선', '수정',
-        # UI/UX 관련
-        '화면', '버튼', '메뉴', '설정', '디자인', '인터페이스', '레이아웃',
-        # 성능 관련
-        '빠름', '느림', '지연', '반응', '처리', '로딩', '시간', '대기'
-    }
-    
-    # 직접 매칭
-    if word in meaningful_keywords:
+    # 직접 매칭 및 부분 매칭 (단어가 키워드에 포함된 경우)
+    if word in _MEANINGFUL_SUBSTRINGS:
         return True
     
-    # 부분 매칭 (키워드가 포함된 경우)
-    for keyword in meaningful_keywords:
-        if keyword in word or word in keyword:
-            return True
+    # 부분 매칭 (키워드가 단어에 포함된 경우)
+    if _MEANINGFUL_RE.search(word):
+        return True
     
     # 한글 2글자 이상이면 일단 포함 (너무 제한적이지 않도록)
-    if len(word) >= 2 and all(ord('가') <= ord(c) <= ord('힣') for c in word):
+    if len(word) >= 2 and _HANGUL_ONLY_RE.fullmatch(word) is not None:
         return True
     
     return False
 
-def calculate_cooccurrence_matrix(reviews: List[Dict], keywords: Dict[str, int], window_size: int = 5) -> Dict[Tuple[str, str], int]:
+def calculate_cooccurrence_matrix(tokenized_reviews: List[List[str]], keywords: Dict[str, int], window_size: int = 5) -> Dict[Tuple[str, str], int]:
     """
     키워드 간 공동 등장 빈도 계산
-    """
-    cooccurrence = defaultdict(int)
-    keyword_set = set(keywords.keys())
     
-    for review in reviews:
-        content = review.get('content', '')
-        words = re.findall(r'[가-힣]{2,6}', content)
-        
-        # 키워드만 필터링
-        review_keywords = [w for w in words if w in keyword_set]
+    한 리뷰 안에서 반복된 키워드는 첫 등장만 남기므로, 같은 키워드 쌍은 리뷰당 최대 1회 집계됨
+    (등장 횟수가 아닌 리뷰 단위 공동 등장 여부 기준)
+    """
+    if np is not None and sum(map(len, tokenized_reviews)) >= VECTORIZE_MIN_TOKENS:
+        return calculate_cooccurrence_matrix_vectorized(tokenized_reviews, keywords, window_size)
+    
+    # 키워드를 정렬 순서의 정수 ID로 바꿔 집계 (작은 ID * 키워드 수 + 큰 ID 정수 키)
+    keyword_list = sorted(keywords)
+    keyword_ids = {keyword: i for i, keyword in enumerate(keyword_list)}
+    n_keywords = len(keyword_list)
+    cooccurrence = Counter()
+    
+    for words in tokenized_reviews:
+        # 키워드만 필터링 (등장 순서를 유지하며 중복 제거)
+        review_ids = list(dict.fromkeys(keyword_ids[w] for w in words if w in keyword_ids))
         
-        # 윈도우 내 키워드 쌍 계산
-        for i, word1 in enumerate(review_keywords):
-            for j in range(i + 1, min(i + window_size + 1, len(review_keywords))):
-                word2 = review_keywords[j]
-                if word1 != word2:
-                    pair = tuple(sorted([word1, word2]))
-                    cooccurrence[pair] += 1
+        # 윈도우 내 키워드 쌍 계산 (리뷰 단위로 모아서 한 번에 집계)
+        cooccurrence.update(
+            id1 * n_keywords + id2 if id1 < id2 else id2 * n_keywords + id1
+            for i, id1 in enumerate(review_ids)
+            for id2 in review_ids[i + 1:i + window_size + 1]
+        )
+    
+    # (키워드1, 키워드2) 정렬 쌍으로 되돌림 (쌍의 첫 등장 순서 유지)
+    return {
+        (keyword_list[pair // n_keywords], keyword_list[pair % n_keywords]): count
+        for pair, count in cooccurrence.items()
+    }
+
+def calculate_cooccurrence_matrix_vectorized(tokenized_reviews: List[List[str]], keywords: Dict[str, int], window_size: int = 5) -> Dict[Tuple[str, str], int]:
+    """
+    NumPy를 사용한 공동 등장 빈도 계산 (calculate_cooccurrence_matrix와 같은 결과와 쌍 순서를 반환)
+    """
+    # 키워드를 문자열 순서대로 정수 ID로 변환 (ID 대소 관계 = 문자열 대소 관계)
+    keyword_list = sorted(keywords)
+    keyword_ids = {keyword: i for i, keyword in enumerate(keyword_list)}
+    num_keywords = len(keyword_list)
+    
+    # 전체 토큰을 하나의 배열로 펼치고 키워드가 아닌 토큰 제거
+    token_ids = np.array([keyword_ids.get(w, -1) for words in tokenized_reviews for w in words], dtype=np.int64)
+    review_index = np.repeat(np.arange(len(tokenized_reviews), dtype=np.int64), [len(words) for words in tokenized_reviews])
+    is_keyword = token_ids >= 0
+    token_ids = token_ids[is_keyword]
+    review_index = review_index[is_keyword]
+    
+    # 리뷰별 첫 등장만 남기기 (등장 순서 유지)
+    _, first_seen = np.unique(review_index * num_keywords + token_ids, return_index=True)
+    first_seen.sort()
+    token_ids = token_ids[first_seen]
+    review_index = review_index[first_seen]
+    
+    # (기준 위치, 거리) 순서로 윈도우 내 쌍 키 생성, 다른 리뷰에 걸친 쌍은 -1로 표시
+    total = len(token_ids)
+    pair_keys = np.full((total, window_size), -1, dtype=np.int64)
+    for distance in range(1, min(window_size, total - 1) + 1):
+        left = token_ids[:-distance]
+        right = token_ids[distance:]
+        same_review = review_index[:-distance] == review_index[distance:]
+        pair_keys[:-distance, distance - 1] = np.where(
+            same_review, np.minimum(left, right) * num_keywords + np.maximum(left, right), -1
+        )
+    pair_keys = pair_keys.ravel()
+    pair_keys = pair_keys[pair_keys >= 0]
+    
+    # 쌍별 빈도를 집계하고 첫 등장 순서로 정렬
+    unique_keys, first_index, counts = np.unique(pair_keys, return_index=True, return_counts=True)
+    order = np.argsort(first_index)
+    word1_ids, word2_ids = np.divmod(unique_keys[order], num_keywords)
     
-    return dict(cooccurrence)
+    return {
+        (keyword_list[word1], keyword_list[word2]): count
+        for word1, word2, count in zip(word1_ids.tolist(), word2_ids.tolist(), counts[order].tolist())
+    }
 
 def calculate_pmi(cooccurrence: Dict[Tuple[str, str], int], keyword_freq: Dict[str, int], total_words: int) -> Dict[Tuple[str, str], float]:
     """
     PMI (Pointwise Mutual Information) 계산
     """
     pmi_scores = {}
+    if not total_words:
+        return pmi_scores
+    
+    # 키워드별 등장 확률을 한 번만 계산 (쌍마다 나눗셈 반복 방지)
+    inv_total = 1.0 / total_words
+    p_keyword = {word: freq * inv_total for word, freq in keyword_freq.items()}
     
     for (word1, word2), cooc_count in cooccurrence.items():
         if cooc_count < 2:  # 최소 공동 등장 빈도
             continue
             
         # PMI 계산
-        p_xy = cooc_count / total_words
-        p_x = keyword_freq[word1] / total_words
-        p_y = keyword_freq[word2] / total_words
+        p_xy = cooc_count * inv_total
+        p_x = p_keyword[word1]
+        p_y = p_keyword[word2]
         
         if p_x > 0 and p_y > 0:
             pmi = math.log(p_xy / (p_x * p_y))
@@ -183,10 +313,32 @@ def simple_clustering_fallback(keywords: Dict[str, int], pmi_scores: Dict[Tuple[
     
     return clusters
 
+def detect_communities_igraph(keywords: Dict[str, int], pmi_scores: Dict[Tuple[str, str], float]) -> List[List[str]]:
+    """
+    igraph를 사용한 커뮤니티 탐지 (NetworkX와 동일한 greedy modularity 알고리즘을 C 구현으로 수행)
+    """
+    keyword_list = list(keywords.keys())
+    index = {keyword: i for i, keyword in enumerate(keyword_list)}
+    
+    # PMI 임계값을 넘는 쌍만 엣지로 추가
+    edges = [(index[word1], index[word2]) for (word1, word2), pmi in pmi_scores.items() if pmi > 0.1]
+    G = ig.Graph(n=len(keyword_list), edges=edges)
+    
+    clustering = G.community_fastgreedy().as_clustering()
+    
+    # 최소 2개 이상의 키워드로 이루어진 커뮤니티만 반환
+    return [[keyword_list[i] for i in members] for members in clustering if len(members) >= 2]
+
 def detect_communities(keywords: Dict[str, int], pmi_scores: Dict[Tuple[str, str], float]) -> List[List[str]]:
     """
-    NetworkX를 사용한 커뮤니티 탐지 (없으면 기본 클러스터링 사용)
+    커뮤니티 탐지 (igraph, NetworkX 순으로 사용하고 둘 다 없으면 기본 클러스터링 사용)
     """
+    if ig is not None:
+        try:
+            return detect_communities_igraph(keywords, pmi_scores)
+        except Exception as e:
+            print(f"igraph community detection failed: {e}", file=sys.stderr)
+    
     if nx is None:
         # NetworkX 없이 기본 클러스터링
         return simple_clustering_fallback(keywords, pmi_scores)
@@ -195,13 +347,12 @@ def detect_communities(keywords: Dict[str, int], pmi_scores: Dict[Tuple[str, str
     G = nx.Graph()
     
     # 노드 추가
-    for keyword, freq in keywords.items():
-        G.add_node(keyword, frequency=freq)
+    G.add_nodes_from((keyword, {'frequency': freq}) for keyword, freq in keywords.items())
     
-    # 엣지 추가 (PMI 기반)
-    for (word1, word2), pmi in pmi_scores.items():
-        if pmi > 0.1:  # PMI 임계값
-            G.add_edge(word1, word2, weight=pmi)
+    # 엣지 추가 (PMI 기반, PMI 임계값 0.1 초과)
+    G.add_weighted_edges_from(
+        (word1, word2, pmi) for (word1, word2), pmi in pmi_scores.items() if pmi > 0.1
+    )
     
     # 커뮤니티 탐지
     try:
@@ -219,42 +370,64 @@ def detect_communities(keywords: Dict[str, int], pmi_scores: Dict[Tuple[str, str
         # 네트워크 기반 클러스터링 실패시 빈도 기반 그룹화
         return [list(keywords.keys())]
 
-def generate_cluster_labels_with_gpt(communities: List[List[str]], keyword_freq: Dict[str, int]) -> Dict[int, str]:
+def generate_cluster_labels_with_gpt(communities: List[List[str]], keyword_freq: Dict[str, int]) -> Tuple[Dict[int, str], bool]:
     """
-    GPT를 사용하여 각 클러스터에 UX 인사이트 중심의 라벨 생성
+    GPT를 사용하여 각 클러스터에 UX 인사이트 중심의 라벨 생성 (fallback 라벨 사용 여부를 함께 반환)
     """
     labels = {}
+    used_fallback = False
     
-    for i, community in enumerate(communities):
-        # 커뮤니티 내 키워드들을 빈도순으로 정렬
-        sorted_keywords = sorted(community, key=lambda x: keyword_freq[x], reverse=True)
-        top_keywords = sorted_keywords[:8]  # 상위 8개 키워드
-        
-        try:
-            # GPT API 호출 (requests 사용 가능한 경우)
-            if requests is not None:
-                response = requests.post(
-                    'http://localhost:5000/api/generate-cluster-label',
-                    json={'keywords': top_keywords},
-                    headers={'Content-Type': 'application/json'},
-                    timeout=30
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    generated_label = result.get('label', f'클러스터 {i+1}').strip('"')
-                    # UX 인사이트 중심으로 라벨 정제
-                    labels[i] = clean_cluster_label(generated_label, top_keywords)
-                else:
-                    labels[i] = generate_fallback_label(top_keywords)
-            else:
-                # requests 없이 fallback 라벨 생성
-                labels[i] = generate_fallback_label(top_keywords)
-        except:
-            # GPT 호출 실패시 대표 키워드 기반 라벨 생성
+    # 커뮤니티 내 키워드 중 빈도 상위 8개 키워드 선택 (전체 정렬 없이 힙으로 선택, 동률 순서는 정렬과 동일)
+    top_keywords_list = [
+        heapq.nlargest(8, community, key=keyword_freq.__getitem__)
+        for community in communities
+    ]
+    
+    # 동일한 상위 키워드 조합은 이전 실행에서 생성한 라벨 재사용 (캐시되지 않은 클러스터만 요청)
+    label_cache = load_label_cache()
+    cache_keys = [get_label_cache_key(top_keywords) for top_keywords in top_keywords_list]
+    uncached_ids = [i for i, key in enumerate(cache_keys) if key not in label_cache]
+    
+    try:
+        # GPT API 호출 (requests 사용 가능한 경우) - 캐시되지 않은 클러스터를 한 번의 요청으로 처리
+        if requests is not None and uncached_ids:
+            response = requests.post(
+                'http://localhost:5000/api/generate-cluster-labels',
+                json={'clusters': [
+                    {'id': i, 'keywords': top_keywords_list[i]}
+                    for i in uncached_ids
+                ]},
+                headers={'Content-Type': 'application/json'},
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                generated_labels = response.json().get('labels', {})
+                now = time.time()
+                cache_updated = False
+                for i in uncached_ids:
+                    generated_label = (generated_labels.get(str(i)) or '').strip('"')
+                    # OpenAI 호출 실패 시 서버가 돌려주는 기본 라벨은 캐시하지 않고 fallback 라벨 사용
+                    if generated_label and generated_label != _PLACEHOLDER_LABEL:
+                        label_cache[cache_keys[i]] = {'label': generated_label, 'ts': now}
+                        cache_updated = True
+                if cache_updated:
+                    save_label_cache(label_cache)
+    except:
+        # GPT 호출 실패시 대표 키워드 기반 라벨 생성
+        pass
+    
+    for i, top_keywords in enumerate(top_keywords_list):
+        if cache_keys[i] in label_cache:
+            generated_label = label_cache[cache_keys[i]]['label']
+            # UX 인사이트 중심으로 라벨 정제
+            labels[i] = clean_cluster_label(generated_label, top_keywords)
+        else:
+            # requests 없이 또는 GPT 호출 실패시 fallback 라벨 생성
             labels[i] = generate_fallback_label(top_keywords)
+            used_fallback = True
     
-    return labels
+    return labels, used_fallback
 
 def clean_cluster_label(label: str, keywords: List[str]) -> str:
     """
@@ -263,16 +436,10 @@ def clean_cluster_label(label: str, keywords: List[str]) -> str:
     # 너무 긴 라벨을 줄임
     if len(label) > 12:
         # 키워드 기반으로 축약
-        if any(k in label for k in ['통화', '전화', '연결']):
-            return '통화 품질'
-        elif any(k in label for k in ['화면', '버튼', '설정']):
-            return 'UI/UX 개선'
-        elif any(k in label for k in ['오류', '문제', '버그']):
-            return '기능 안정성'
-        elif any(k in label for k in ['편리', '불편', '사용']):
-            return '사용성 개선'
-        else:
-            return label[:10] + '...'
+        for pattern, category in _CLEAN_LABEL_BUCKETS:
+            if pattern.search(label):
+                return category
+        return label[:10] + '...'
     
     return label
 
@@ -286,18 +453,10 @@ def generate_fallback_label(keywords: List[str]) -> str:
     # 대표 키워드 기반 카테고리 분류
     primary_keyword = keywords[0]
     
-    if any(k in primary_keyword for k in ['통화', '전화', '연결', '수신', '발신']):
-        return '통화 기능'
-    elif any(k in primary_keyword for k in ['화면', '버튼', '메뉴', '설정']):
-        return 'UI 요소'
-    elif any(k in primary_keyword for k in ['오류', '문제', '버그', '실패']):
-        return '안정성 문제'
-    elif any(k in primary_keyword for k in ['음성', '소리', '녹음', '볼륨']):
-        return '음성 품질'
-    elif any(k in primary_keyword for k in ['편리', '불편', '사용', '조작']):
-        return '사용성'
-    else:
-        return f'{primary_keyword} 관련'
+    for pattern, category in _FALLBACK_LABEL_BUCKETS:
+        if pattern.search(primary_keyword):
+            return category
+    return f'{primary_keyword} 관련'
 
 def create_network_visualization_data(
     keywords: Dict[str, int],
@@ -315,36 +474,52 @@ def create_network_visualization_data(
             keyword_to_cluster[keyword] = cluster_id
     
     # 노드 데이터 생성
-    nodes = []
     max_freq = max(keywords.values()) if keywords else 1
     
-    for keyword, freq in keywords.items():
-        cluster_id = keyword_to_cluster.get(keyword, 0)
-        node = {
+    if np is not None and keywords:
+        # 빈도에 따른 크기를 배열 연산으로 한 번에 계산
+        freqs = np.fromiter(keywords.values(), dtype=np.int64, count=len(keywords))
+        node_sizes = np.maximum(10, (30 * freqs / max_freq).astype(np.int64)).tolist()
+    else:
+        node_sizes = [max(10, int(30 * freq / max_freq)) for freq in keywords.values()]
+    
+    nodes = [
+        {
             'id': keyword,
             'label': keyword,
-            'size': max(10, int(30 * freq / max_freq)),  # 빈도에 따른 크기
+            'size': size,  # 빈도에 따른 크기
             'frequency': freq,
-            'cluster': cluster_id
+            'cluster': keyword_to_cluster.get(keyword, 0)
         }
-        nodes.append(node)
+        for (keyword, freq), size in zip(keywords.items(), node_sizes)
+    ]
     
-    # 엣지 데이터 생성
-    edges = []
-    edge_id = 0
+    # 엣지 데이터 생성 (PMI 임계값 0.1 초과만 사용)
     max_pmi = max(pmi_scores.values()) if pmi_scores else 1
     
-    for (word1, word2), pmi in pmi_scores.items():
-        if pmi > 0.1:  # PMI 임계값
-            edge = {
-                'id': edge_id,
-                'source': word1,
-                'target': word2,
-                'weight': max(1, int(10 * pmi / max_pmi)),  # PMI에 따른 가중치
-                'pmi': pmi
-            }
-            edges.append(edge)
-            edge_id += 1
+    if np is not None and pmi_scores:
+        # PMI 임계값 필터링과 가중치 계산을 배열 연산으로 처리
+        pmis = np.fromiter(pmi_scores.values(), dtype=np.float64, count=len(pmi_scores))
+        mask = pmis > 0.1
+        edge_pairs = list(compress(pmi_scores, mask.tolist()))
+        edge_pmis = pmis[mask]
+        edge_weights = np.maximum(1, (10 * edge_pmis / max_pmi).astype(np.int64)).tolist()
+        edge_pmis = edge_pmis.tolist()
+    else:
+        edge_pairs = [pair for pair, pmi in pmi_scores.items() if pmi > 0.1]
+        edge_pmis = [pmi_scores[pair] for pair in edge_pairs]
+        edge_weights = [max(1, int(10 * pmi / max_pmi)) for pmi in edge_pmis]
+    
+    edges = [
+        {
+            'id': edge_id,
+            'source': word1,
+            'target': word2,
+            'weight': weight,  # PMI에 따른 가중치
+            'pmi': pmi
+        }
+        for edge_id, ((word1, word2), weight, pmi) in enumerate(zip(edge_pairs, edge_weights, edge_pmis))
+    ]
     
     # 클러스터 데이터 생성
     clusters = []
@@ -372,18 +547,26 @@ def analyze_keyword_network(reviews: List[Dict]) -> Dict[str, Any]:
     """
     키워드 네트워크 분석 메인 함수
     """
+    network_data, _ = analyze_keyword_network_with_fallback(reviews)
+    return network_data
+
+def analyze_keyword_network_with_fallback(reviews: List[Dict]) -> Tuple[Dict[str, Any], bool]:
+    """
+    키워드 네트워크 분석 후 (결과, fallback 라벨 사용 여부) 반환 (main의 결과 캐시 판단용)
+    """
     if not reviews:
         return {
             'nodes': [],
             'edges': [],
             'clusters': [],
             'stats': {'total_nodes': 0, 'total_edges': 0, 'total_clusters': 0}
-        }
+        }, False
     
     # print(f"Starting keyword network analysis for {len(reviews)} reviews")
     
-    # 1. 키워드 추출
-    keywords = extract_meaningful_keywords(reviews)
+    # 1. 키워드 추출 (리뷰 토큰화는 한 번만 수행하여 이후 단계에서 재사용)
+    tokenized_reviews = tokenize_reviews(reviews)
+    keywords = extract_meaningful_keywords(tokenized_reviews)
     # 디버깅 정보 제거
     
     if len(keywords) < 3:
@@ -393,11 +576,11 @@ def analyze_keyword_network(reviews: List[Dict]) -> Dict[str, Any]:
             'clusters': [],
             'stats': {'total_nodes': 0, 'total_edges': 0, 'total_clusters': 0},
             'message': '키워드가 부족하여 네트워크 분석을 수행할 수 없습니다. 더 많은 리뷰를 수집하거나 날짜 범위를 확장해주세요.'
-        }
+        }, False
     
     # 2. 공동 등장 분석
     total_words = sum(keywords.values())
-    cooccurrence = calculate_cooccurrence_matrix(reviews, keywords)
+    cooccurrence = calculate_cooccurrence_matrix(tokenized_reviews, keywords)
     # print(f"Calculated co-occurrence for {len(cooccurrence)} keyword pairs")
     
     # 3. PMI 계산
@@ -409,13 +592,97 @@ def analyze_keyword_network(reviews: List[Dict]) -> Dict[str, Any]:
     # print(f"Detected {len(communities)} communities")
     
     # 5. GPT 클러스터 라벨링
-    cluster_labels = generate_cluster_labels_with_gpt(communities, keywords)
+    cluster_labels, used_fallback = generate_cluster_labels_with_gpt(communities, keywords)
     # print(f"Generated labels for {len(cluster_labels)} clusters")
     
     # 6. 시각화 데이터 생성
     network_data = create_network_visualization_data(keywords, pmi_scores, communities, cluster_labels)
     
-    return network_data
+    return network_data, used_fallback
+
+def get_cache_path(reviews: List[Dict]) -> str:
+    """
+    리뷰 내용 해시 기반 분석 결과 캐시 파일 경로 (분석은 content만 사용하므로 content 순서열로 키 생성)
+    """
+    contents = json.dumps([review.get('content', '') for review in reviews], ensure_ascii=False)
+    key = hashlib.blake2b(contents.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(tempfile.gettempdir(), f'kwnet_{key}.json')
+
+def load_cached_result(cache_path: str):
+    """
+    유효 시간 내의 캐시된 분석 결과 로드 (없거나 손상 시 None, 만료된 파일은 삭제 후 None)
+    """
+    try:
+        if time.time() - os.path.getmtime(cache_path) > CACHE_TTL_SECONDS:
+            os.remove(cache_path)
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_result(cache_path: str, result: Dict[str, Any]) -> None:
+    """
+    분석 결과를 캐시 파일로 저장 (다른 프로세스가 부분 파일을 읽지 않도록 교체 방식으로 기록)
+    """
+    try:
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+def remove_expired_cache_files() -> None:
+    """
+    유효 시간이 지난 kwnet_*.json 분석 결과 캐시 파일 삭제 (항목별로 만료되는 라벨 캐시 파일은 제외)
+    """
+    expire_before = time.time() - CACHE_TTL_SECONDS
+    for cache_path in glob.glob(os.path.join(tempfile.gettempdir(), 'kwnet_*.json')):
+        if cache_path == LABEL_CACHE_PATH:
+            continue
+        try:
+            if os.path.getmtime(cache_path) < expire_before:
+                os.remove(cache_path)
+        except OSError:
+            pass
+
+def get_label_cache_key(top_keywords: List[str]) -> str:
+    """
+    클러스터 라벨 캐시 키 (빈도 순서가 달라도 같은 키워드 조합이면 같은 키)
+    """
+    return '\x1f'.join(sorted(top_keywords))
+
+def load_label_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    클러스터 라벨 캐시 로드 (항목별 생성 시각 기준으로 만료된 항목 제외, 없거나 손상 시 빈 딕셔너리)
+    """
+    try:
+        with open(LABEL_CACHE_PATH, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict):
+        return {}
+    
+    expire_before = time.time() - CACHE_TTL_SECONDS
+    return {
+        key: entry for key, entry in cached.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get('label'), str)
+        and isinstance(entry.get('ts'), (int, float))
+        and entry['ts'] >= expire_before
+    }
+
+def save_label_cache(label_cache: Dict[str, Dict[str, Any]]) -> None:
+    """
+    클러스터 라벨 캐시 저장 (생성 시각이 오래된 항목부터 버려 LABEL_CACHE_MAX_ENTRIES개 유지)
+    """
+    if len(label_cache) > LABEL_CACHE_MAX_ENTRIES:
+        label_cache = dict(heapq.nlargest(
+            LABEL_CACHE_MAX_ENTRIES, label_cache.items(), key=lambda item: item[1]['ts']
+        ))
+    save_cached_result(LABEL_CACHE_PATH, label_cache)
 
 def main():
     """
@@ -432,12 +699,28 @@ def main():
         with open(reviews_file_path, 'r', encoding='utf-8') as f:
             reviews = json.load(f)
         
-        result = analyze_keyword_network(reviews)
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        # 동일한 리뷰 집합은 캐시된 결과 재사용 (공동 등장/커뮤니티 탐지 생략)
+        cache_path = get_cache_path(reviews)
+        result = load_cached_result(cache_path)
+        if result is None:
+            remove_expired_cache_files()
+            result, used_fallback = analyze_keyword_network_with_fallback(reviews)
+            # GPT 라벨 대신 fallback 라벨이 들어간 결과는 다음 실행에서 다시 라벨링하도록 캐시하지 않음
+            if not used_fallback:
+                save_cached_result(cache_path, result)
+        
+        # 전체 문자열을 만들지 않고 stdout으로 바로 직렬화
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
+        else:
+            json.dump(result, sys.stdout, ensure_ascii=False, separators=(',', ':'))
+            sys.stdout.write('\n')
+            sys.stdout.flush()
         
         # 임시 파일 정리
         try:
-            import os
             os.remove(reviews_file_path)
         except:
             pass
@@ -6,18 +6,147 @@ Naver API Integration for Blog and Cafe Search
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import urllib.parse
 import sys
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html import unescape
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import os
 NAVER_CLIENT_ID = os.environ.get('NAVER_CLIENT_ID')
 NAVER_CLIENT_SECRET = os.environ.get('NAVER_CLIENT_SECRET')
 
+# 네이버 검색 API 호출 제한 (초당 요청 수) 및 429 응답 재시도 횟수
+NAVER_RATE_LIMIT = 10
+NAVER_MAX_RETRIES = 3
+
+# 검색어마다 새 TCP/TLS 연결을 맺지 않도록 커넥션 풀을 공유하는 세션
+# (연결 오류만 재시도하며, 429 응답은 _naver_get에서 백오프 처리)
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# HTML 태그 및 연속 공백 제거 패턴
+_TAG_RE = re.compile(r'<[^>]+>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 블로그 사용자 ID / 카페 이름 추출 패턴
+_BLOG_USER_RE = re.compile(r'blog\.naver\.com/([^/?]+)')
+_CAFE_NAME_RE = re.compile(r'cafe\.naver\.com/([^/?]+)')
+
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+def _wait_for_rate_limit():
+    """
+    Block until the next Naver API call fits within NAVER_RATE_LIMIT
+    
+    Calls from concurrent crawler threads are spaced evenly instead of
+    being serialized one keyword at a time.
+    """
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        scheduled = max(now, _next_request_at)
+        _next_request_at = scheduled + 1.0 / NAVER_RATE_LIMIT
+    if scheduled > now:
+        time.sleep(scheduled - now)
+
+def _naver_get(url, headers):
+    """
+    Rate-limited GET against the Naver API with exponential backoff on 429
+    
+    The response is opened in streaming mode; callers must close it.
+    
+    Args:
+        url: Request URL
+        headers: Request headers including Naver credentials
+        
+    Returns:
+        requests.Response of the last attempt
+    """
+    for attempt in range(NAVER_MAX_RETRIES):
+        _wait_for_rate_limit()
+        res = _session.get(url, headers=headers, timeout=10, stream=True)
+        if res.status_code != 429 or attempt == NAVER_MAX_RETRIES - 1:
+            break
+        res.close()
+        time.sleep(0.5 * 2 ** attempt)
+    return res
+
+def _iter_items(res):
+    """
+    Iterate the search result items of a Naver API response
+    
+    With ijson the items are parsed incrementally from the response stream
+    instead of decoding the whole body into one object with res.json().
+    Without ijson the body is decoded with orjson when available.
+    """
+    if ijson:
+        res.raw.decode_content = True
+        return ijson.items(res.raw, 'items.item', use_float=True)
+    if orjson:
+        return orjson.loads(res.content).get("items", [])
+    return res.json().get("items", [])
+
+def _fetch_items(url, headers):
+    """
+    Fetch the search result items of one Naver API query
+    
+    Errors are reported and yield the items read so far (usually none),
+    so one failed query does not abort the others.
+    
+    Args:
+        url: Request URL
+        headers: Request headers including Naver credentials
+        
+    Returns:
+        List of result items
+    """
+    try:
+        res = _naver_get(url, headers)
+    except requests.exceptions.RequestException as e:
+        print(f"네이버 API 요청 실패: {str(e)}", file=sys.stderr)
+        return []
+    
+    items = []
+    try:
+        if res.status_code == 200:
+            for item in _iter_items(res):
+                items.append(item)
+        else:
+            print(f"네이버 API 오류: {res.status_code} - {res.text}", file=sys.stderr)
+    except Exception as e:
+        print(f"네이버 API 응답 처리 실패: {str(e)}", file=sys.stderr)
+    finally:
+        res.close()
+    return items
+
+@lru_cache(maxsize=2048)
 def extract_user_id_from_url(bloggerlink, link, search_type):
     """
     Extract user ID from Naver Blog or Cafe URL
     
+    Results are cached because the same post often comes back from more
+    than one of the search queries.
+    
     Args:
         bloggerlink: Blogger link (for blog)
         link: Direct link to the content
@@ -31,14 +160,14 @@ def extract_user_id_from_url(bloggerlink, link, search_type):
             # For blog, try to extract from bloggerlink first
             if bloggerlink:
                 # Pattern: https://blog.naver.com/USERNAME
-                match = re.search(r'blog\.naver\.com/([^/?]+)', bloggerlink)
+                match = _BLOG_USER_RE.search(bloggerlink)
                 if match:
                     return match.group(1)
             
             # If bloggerlink fails, try from link
             if link:
                 # Pattern: https://blog.naver.com/USERNAME/POST_ID
-                match = re.search(r'blog\.naver\.com/([^/?]+)', link)
+                match = _BLOG_USER_RE.search(link)
                 if match:
                     return match.group(1)
                     
@@ -46,7 +175,7 @@ def extract_user_id_from_url(bloggerlink, link, search_type):
             # For cafe, extract from link
             if link:
                 # Pattern: https://cafe.naver.com/CAFE_NAME/ARTICLE_ID
-                match = re.search(r'cafe\.naver\.com/([^/?]+)', link)
+                match = _CAFE_NAME_RE.search(link)
                 if match:
                     return f"카페_{match.group(1)}"
                     
@@ -84,109 +213,132 @@ def search_naver(keyword, search_type="blog", display=10, start_date=None, end_d
         urllib.parse.quote(f"{keyword} 리뷰")  # 리뷰 관련 검색
     ]
     
+    # display 값 범위 제한 (1-100)
+    safe_display = min(max(1, display), 100)
+    urls = [f"{base_url}?query={query}&display={safe_display}&sort=date" for query in queries]  # 최신순 정렬 추가
+    
+    headers = {
+        "X-Naver-Client-Id": NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
+    }
+    
     all_results = []
     seen_links = set()
     
-    for query in queries:
-        # display 값 범위 제한 (1-100)
-        safe_display = min(max(1, display), 100)
-        url = f"{base_url}?query={query}&display={safe_display}&sort=date"  # 최신순 정렬 추가
-
-        headers = {
-            "X-Naver-Client-Id": NAVER_CLIENT_ID,
-            "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-        }
-
-        try:
-            res = requests.get(url, headers=headers, timeout=10)
-            
-            if res.status_code == 200:
-                items = res.json().get("items", [])
-                # Extract user IDs from URLs and avoid duplicates
-                for item in items:
-                    link = item.get('link', '')
-                    if link not in seen_links:
-                        seen_links.add(link)
-                        user_id = extract_user_id_from_url(item.get('bloggerlink', ''), link, search_type)
-                        item['extracted_user_id'] = user_id
-                        all_results.append(item)
-                        
-                        # 목표 수량에 도달하면 종료
-                        if len(all_results) >= display:
-                            break
-            else:
-                print(f"네이버 API 오류: {res.status_code} - {res.text}", file=sys.stderr)
+    def collect(items):
+        """Add unseen items in order; returns True once display results are collected"""
+        # Extract user IDs from URLs and avoid duplicates
+        for item in items:
+            link = item.get('link', '')
+            if link not in seen_links:
+                seen_links.add(link)
+                user_id = extract_user_id_from_url(item.get('bloggerlink', ''), link, search_type)
+                item['extracted_user_id'] = user_id
+                all_results.append(item)
                 
-        except requests.exceptions.RequestException as e:
-            print(f"네이버 API 요청 실패: {str(e)}", file=sys.stderr)
-            continue
-        
-        # 목표 수량에 도달하면 종료
-        if len(all_results) >= display:
-            break
+                # 목표 수량에 도달하면 종료
+                if len(all_results) >= display:
+                    return True
+        return len(all_results) >= display
+    
+    # 정확 검색 결과로 충분하면 추가 검색 생략, 부족하면 나머지 검색어를 동시에 요청
+    # (결과는 검색어 순서대로 병합하여 기존 우선순위 유지)
+    if not collect(_fetch_items(urls[0], headers)):
+        with ThreadPoolExecutor(max_workers=len(urls) - 1) as executor:
+            for items in executor.map(lambda url: _fetch_items(url, headers), urls[1:]):
+                if collect(items):
+                    break
     
     return all_results[:display]
 
+@lru_cache(maxsize=4096)
 def extract_text_from_html(html_content):
     """
     Extract plain text from HTML content
     
+    Results are cached because is_likely_user_review and the scrapers clean
+    the same title/description strings more than once.
+    
     Args:
         html_content: HTML string
         
     Returns:
         Plain text string
     """
-    import re
-    
     if not html_content:
         return ""
     
-    # Remove HTML tags including <b>, <i>, <strong>, etc.
-    clean_text = re.sub(r'<[^>]+>', '', html_content)
+    # Remove HTML tags including <b>, <i>, <strong>, etc. (skipped when there is no '<')
+    clean_text = _TAG_RE.sub('', html_content) if '<' in html_content else html_content
     
-    # Decode HTML entities
-    clean_text = clean_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-    clean_text = clean_text.replace('&quot;', '"').replace('&#39;', "'")
-    clean_text = clean_text.replace('&nbsp;', ' ').replace('&hellip;', '...')
+    # Decode HTML entities (html.unescape returns strings without '&' unchanged)
+    clean_text = unescape(clean_text)
     
     # Remove extra whitespace
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-    
-    return clean_text
+    return _WHITESPACE_RE.sub(' ', clean_text).strip()
+
+# 이전 이름 호환용 (동일한 동작)
+strip_html = extract_text_from_html
+
+# 사용자 리뷰 판별: 뉴스기사 및 정보성 글 제외 키워드
+_REVIEW_EXCLUSION_KEYWORDS = [
+    "뉴스", "기사", "보도", "보도자료", "press", "언론", "미디어", 
+    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
+    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드",
+    # 서평/도서 관련 (네이버 카페에서 흔함)
+    "서평", "도서", "책", "독서", "독후감", "리뷰 이벤트", "서평단",
+    # 배경화면/테마 관련
+    "배경화면", "테마", "다운로드", "라이브 배경화면", "플라밍고",
+    # 일반적인 정보성 포스트
+    "정보", "소식", "업데이트", "버전", "기능", "특징", "서비스 소개",
+    "스펙", "사양", "가격", "요금", "플랜", "구독", "설치", "출시",
+    # 홍보/마케팅
+    "이벤트", "프로모션", "광고", "홍보", "마케팅", "런칭", "공식",
+    "캠페인", "안내", "알림", "공지", "발표"
+]
+
+# 사용자 리뷰 판별: 리뷰 지표 키워드
+_REVIEW_INDICATORS = [
+    # 사용 경험 관련
+    "사용해보니", "써보니", "체험해보니", "테스트해보니", "사용기", "체험기", "사용후기",
+    # 평가 관련
+    "후기", "리뷰", "평가", "평점", "별점", "만족", "불만족", "만족도",
+    # 추천/비추천
+    "추천", "비추천", "권장", "비권장", "좋아요", "싫어요", "괜찮아요",
+    # 장단점
+    "장점", "단점", "아쉬운", "좋은점", "나쁜점", "문제점", "개선점",
+    # 감정적 반응
+    "편리", "불편", "유용", "도움", "짜증", "답답", "만족스럽", "실망",
+    # 구체적인 사용 상황
+    "통화", "전화", "녹음", "음성", "보이스피싱", "비서",
+    # 일반적인 사용자 리뷰 표현
+    "정말", "너무", "완전", "진짜", "솔직히", "개인적으로"
+]
 
-def strip_html(html_content):
+# 키워드 목록을 하나의 패턴으로 묶어 텍스트를 한 번만 검색
+_REVIEW_EXCLUSION_RE = re.compile('|'.join(map(re.escape, _REVIEW_EXCLUSION_KEYWORDS)))
+_REVIEW_INDICATOR_RE = re.compile('|'.join(map(re.escape, _REVIEW_INDICATORS)))
+
+@lru_cache(maxsize=32)
+def _service_keyword_re(service_keywords):
     """
-    Strip HTML tags from content
+    Compile the (lowercased) service keywords into one alternation pattern
     
     Args:
-        html_content: HTML string
+        service_keywords: Tuple of service-related keywords
         
     Returns:
-        Plain text string
+        Compiled regex matching any of the keywords
     """
-    import re
-    
-    if not html_content:
-        return ""
-    
-    # Remove HTML tags including <b>, <i>, <strong>, etc.
-    clean_text = re.sub(r'<[^>]+>', '', html_content)
-    
-    # Decode HTML entities
-    clean_text = clean_text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-    clean_text = clean_text.replace('&quot;', '"').replace('&#39;', "'")
-    clean_text = clean_text.replace('&nbsp;', ' ').replace('&hellip;', '...')
-    
-    # Remove extra whitespace
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-    
-    return clean_text
+    return re.compile('|'.join(re.escape(sk.lower()) for sk in service_keywords))
 
 def is_likely_user_review(item, service_keywords):
     """
     Check if the search result item is likely a genuine user review
     
+    Checks run cheapest first: the length limit, then one regex search each
+    for service keywords, exclusion keywords and review indicators.
+    
     Args:
         item: Search result item from Naver API
         service_keywords: List of service-related keywords
@@ -196,57 +348,22 @@ def is_likely_user_review(item, service_keywords):
     """
     try:
         # HTML 제거
-        title = strip_html(item.get("title", "")).lower()
-        desc = strip_html(item.get("description", "")).lower()
-        text = title + " " + desc
+        text = (strip_html(item.get("title", "")) + " " + strip_html(item.get("description", ""))).lower()
 
-        # 1. 강화된 뉴스기사 및 정보성 글 제외
-        exclusion_keywords = [
-            "뉴스", "기사", "보도", "보도자료", "press", "언론", "미디어", 
-            "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
-            "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드",
-            # 서평/도서 관련 (네이버 카페에서 흔함)
-            "서평", "도서", "책", "독서", "독후감", "리뷰 이벤트", "서평단",
-            # 배경화면/테마 관련
-            "배경화면", "테마", "다운로드", "라이브 배경화면", "플라밍고",
-            # 일반적인 정보성 포스트
-            "정보", "소식", "업데이트", "버전", "기능", "특징", "서비스 소개",
-            "스펙", "사양", "가격", "요금", "플랜", "구독", "설치", "출시",
-            # 홍보/마케팅
-            "이벤트", "프로모션", "광고", "홍보", "마케팅", "런칭", "공식",
-            "캠페인", "안내", "알림", "공지", "발표"
-        ]
-        
-        if any(keyword in text for keyword in exclusion_keywords):
+        # 1. 길이 제한 (너무 짧으면 제외)
+        if len(text) < 30:
             return False
 
         # 2. 서비스 키워드 포함 확인
-        if not any(sk.lower() in text for sk in service_keywords):
+        if not service_keywords or not _service_keyword_re(tuple(service_keywords)).search(text):
             return False
 
-        # 3. 강화된 리뷰 지표 확인
-        review_indicators = [
-            # 사용 경험 관련
-            "사용해보니", "써보니", "체험해보니", "테스트해보니", "사용기", "체험기", "사용후기",
-            # 평가 관련
-            "후기", "리뷰", "평가", "평점", "별점", "만족", "불만족", "만족도",
-            # 추천/비추천
-            "추천", "비추천", "권장", "비권장", "좋아요", "싫어요", "괜찮아요",
-            # 장단점
-            "장점", "단점", "아쉬운", "좋은점", "나쁜점", "문제점", "개선점",
-            # 감정적 반응
-            "편리", "불편", "유용", "도움", "짜증", "답답", "만족스럽", "실망",
-            # 구체적인 사용 상황
-            "통화", "전화", "녹음", "음성", "보이스피싱", "비서",
-            # 일반적인 사용자 리뷰 표현
-            "정말", "너무", "완전", "진짜", "솔직히", "개인적으로"
-        ]
-        
-        if not any(indicator in text for indicator in review_indicators):
+        # 3. 강화된 뉴스기사 및 정보성 글 제외
+        if _REVIEW_EXCLUSION_RE.search(text):
             return False
 
-        # 4. 길이 제한 (너무 짧으면 제외)
-        if len(text) < 30:
+        # 4. 강화된 리뷰 지표 확인
+        if not _REVIEW_INDICATOR_RE.search(text):
             return False
 
         return True
@@ -15,13 +15,38 @@ import math
 import sys
 import os
 import requests
-from collections import defaultdict, Counter
+from collections import Counter
 from itertools import combinations
 from typing import Dict, List, Tuple, Any
 
-def extract_negative_keywords(reviews: List[Dict]) -> Dict[str, int]:
+# orjson 설치 확인 (있으면 결과 JSON 직렬화에 사용)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 명확한 부정 표현 (감정 라벨이 부정이 아니어도 부정 리뷰로 포함)
+_NEGATIVE_CUE_RE = re.compile(r'불편|안되|안돼|문제|오류|실패|느림|끊어|멈춤|복잡|어려|힘들')
+
+# 한글 2-6자 키워드 추출 패턴
+_KOREAN_WORD_RE = re.compile(r'[가-힣]{2,6}')
+
+# 불용어 리스트 (제외할 단어들)
+_STOPWORDS = frozenset({
+    '익시오', '앱', '어플', '애플리케이션', '유플러스', 'LG', 'LGU', 'U+',
+    '사용', '사용자', '좋다', '나쁘다', '괜찮다', '별로', '그냥', '정말',
+    '너무', '조금', '많이', '아주', '가끔', '항상', '때문', '이제', '지금',
+    '이번', '다음', '처음', '마지막', '하지만', '그래서', '그리고', '또한',
+    '수', '있다', '없다', '된다', '한다', '같다', '다르다', '것', '거', '게',
+    '서비스', '기능', '시스템'
+})
+
+def extract_negative_keywords(reviews: List[Dict]) -> Tuple[Dict[str, int], List[Tuple[Dict, List[str]]]]:
     """
     부정 리뷰에서만 키워드를 추출하고 상위 20개 선택
+    
+    Returns:
+        (상위 20개 키워드 빈도, 부정 리뷰별 (리뷰, 한글 토큰 목록)) - 토큰은 공동 등장 분석에서 재사용
     """
     # 부정 리뷰만 필터링 (더 관대한 조건)
     negative_reviews = []
@@ -30,111 +55,61 @@ def extract_negative_keywords(reviews: List[Dict]) -> Dict[str, int]:
         content = r.get('content', '')
         
         # 감정이 부정이거나, 명확한 부정 표현이 있는 리뷰 포함
-        if (sentiment == '부정' or 
-            '불편' in content or '안되' in content or '안돼' in content or 
-            '문제' in content or '오류' in content or '실패' in content or
-            '느림' in content or '끊어' in content or '멈춤' in content or
-            '복잡' in content or '어려' in content or '힘들' in content):
+        if sentiment == '부정' or _NEGATIVE_CUE_RE.search(content):
             negative_reviews.append(r)
     
     if not negative_reviews:
-        return {}
+        return {}, []
     
     print(f"부정 리뷰 {len(negative_reviews)}개에서 키워드 추출 중...", file=sys.stderr)
     
     keyword_freq = Counter()
     
-    # 불용어 리스트 (제외할 단어들)
-    stopwords = {
-        '익시오', '앱', '어플', '애플리케이션', '유플러스', 'LG', 'LGU', 'U+',
-        '사용', '사용자', '좋다', '나쁘다', '괜찮다', '별로', '그냥', '정말',
-        '너무', '조금', '많이', '아주', '가끔', '항상', '때문', '이제', '지금',
-        '이번', '다음', '처음', '마지막', '하지만', '그래서', '그리고', '또한',
-        '수', '있다', '없다', '된다', '한다', '같다', '다르다', '것', '거', '게',
-        '서비스', '기능', '시스템'
-    }
-    
+    review_tokens = []
     for review in negative_reviews:
-        content = review.get('content', '')
-        
         # 한글 키워드 추출 (2-6자)
-        korean_words = re.findall(r'[가-힣]{2,6}', content)
+        korean_words = _KOREAN_WORD_RE.findall(review.get('content', ''))
+        review_tokens.append((review, korean_words))
         
-        for word in korean_words:
-            # 불용어 제거
-            if word in stopwords:
-                continue
-                
-            # 의미있는 키워드만 선택
-            if is_meaningful_keyword(word):
-                keyword_freq[word] += 1
+        # 불용어 제거 후 빈도 집계
+        # (_KOREAN_WORD_RE 토큰은 2-6자 완성형 한글이라 모두 의미있는 키워드 조건을 만족하므로 별도 판별 없음)
+        keyword_freq.update(word for word in korean_words if word not in _STOPWORDS)
     
     # 상위 20개 키워드만 선택
     top_keywords = dict(keyword_freq.most_common(20))
     
     print(f"상위 20개 키워드 선택: {list(top_keywords.keys())}", file=sys.stderr)
     
-    return top_keywords
+    return top_keywords, review_tokens
 
-def is_meaningful_keyword(word: str) -> bool:
-    """
-    의미있는 키워드인지 판단
+def calculate_cooccurrence_matrix(tokenized_reviews: List[List[str]], keywords: Dict[str, int], window_size: int = 5) -> Dict[Tuple[str, str], int]:
     """
-    # UX 관련 키워드 (문제점, 감정, 기능 관련)
-    meaningful_keywords = {
-        # 문제 관련
-        '오류', '버그', '문제', '에러', '실패', '작동', '멈춤', '충돌', '끊어짐',
-        '안되', '안돼', '안됨', '불가', '차단', '제한', '금지', '거부',
-        # 감정 표현
-        '불편', '불만', '답답', '짜증', '화남', '실망', '후회', '스트레스',
-        '귀찮', '복잡', '어려', '힘들', '형편없', '구리', '최악', '렉',
-        # 기능 관련
-        '통화', '전화', '연결', '수신', '발신', '녹음', '음성', '소리',
-        '화면', '버튼', '메뉴', '설정', '배터리', '메모리', '속도', '느림',
-        '빠름', '반응', '처리', '로딩', '시간', '대기', '지연'
-    }
-    
-    # 직접 매칭
-    if word in meaningful_keywords:
-        return True
+    키워드 간 공동 등장 빈도 계산 (리뷰별 한글 토큰 목록 사용)
     
-    # 부분 매칭
-    for keyword in meaningful_keywords:
-        if keyword in word or word in keyword:
-            return True
-    
-    # 한글 2글자 이상이면 포함 (더 관대하게)
-    if len(word) >= 2 and all(ord('가') <= ord(c) <= ord('힣') for c in word):
-        return True
-    
-    return False
-
-def calculate_cooccurrence_matrix(reviews: List[Dict], keywords: Dict[str, int], window_size: int = 5) -> Dict[Tuple[str, str], int]:
+    키워드를 정렬 순서의 정수 ID로 바꿔 집계하고 (작은 ID * 키워드 수 + 큰 ID 정수 키),
+    마지막에 (키워드1, 키워드2) 정렬 쌍으로 되돌림 (쌍의 첫 등장 순서 유지)
     """
-    키워드 간 공동 등장 빈도 계산
-    """
-    cooccurrence = defaultdict(int)
-    keyword_set = set(keywords.keys())
-    
-    # 부정 리뷰만 사용
-    negative_reviews = [r for r in reviews if r.get('sentiment', '').strip() == '부정']
+    keyword_list = sorted(keywords)
+    keyword_ids = {keyword: i for i, keyword in enumerate(keyword_list)}
+    n_keywords = len(keyword_list)
+    cooccurrence = Counter()
     
-    for review in negative_reviews:
-        content = review.get('content', '')
-        words = re.findall(r'[가-힣]{2,6}', content)
-        
+    for words in tokenized_reviews:
         # 키워드만 필터링
-        review_keywords = [w for w in words if w in keyword_set]
+        review_ids = [keyword_ids[w] for w in words if w in keyword_ids]
         
-        # 윈도우 내 키워드 쌍 계산
-        for i, word1 in enumerate(review_keywords):
-            for j in range(i + 1, min(i + window_size + 1, len(review_keywords))):
-                word2 = review_keywords[j]
-                if word1 != word2:
-                    pair = tuple(sorted([word1, word2]))
-                    cooccurrence[pair] += 1
+        # 윈도우 내 키워드 쌍 계산 (리뷰 단위로 모아서 한 번에 집계)
+        cooccurrence.update(
+            id1 * n_keywords + id2 if id1 < id2 else id2 * n_keywords + id1
+            for i, id1 in enumerate(review_ids)
+            for id2 in review_ids[i + 1:i + window_size + 1]
+            if id1 != id2
+        )
     
-    return dict(cooccurrence)
+    return {
+        (keyword_list[pair // n_keywords], keyword_list[pair % n_keywords]): count
+        for pair, count in cooccurrence.items()
+    }
 
 def calculate_pmi(cooccurrence: Dict[Tuple[str, str], int], keyword_freq: Dict[str, int], total_words: int) -> Dict[Tuple[str, str], float]:
     """
@@ -326,7 +301,7 @@ def analyze_negative_keyword_network(reviews: List[Dict]) -> Dict[str, Any]:
         print(f"부정 리뷰 수: {len(negative_reviews)}", file=sys.stderr)
         
         # 1. 부정 리뷰에서 상위 20개 키워드 추출
-        keywords = extract_negative_keywords(reviews)
+        keywords, review_tokens = extract_negative_keywords(reviews)
         
         if not keywords:
             print("부정 리뷰에서 키워드를 찾을 수 없습니다.", file=sys.stderr)
@@ -349,7 +324,12 @@ def analyze_negative_keyword_network(reviews: List[Dict]) -> Dict[str, Any]:
             }
         
         # 2. 키워드 간 공동 등장 분석
-        cooccurrence = calculate_cooccurrence_matrix(reviews, keywords)
+        # (감정 라벨이 부정인 리뷰만 사용, 추출 단계의 토큰 재사용)
+        negative_tokens = [
+            tokens for review, tokens in review_tokens
+            if review.get('sentiment', '').strip() == '부정'
+        ]
+        cooccurrence = calculate_cooccurrence_matrix(negative_tokens, keywords)
         
         # 3. PMI 계산
         total_words = sum(keywords.values())
@@ -399,8 +379,15 @@ def main():
         # 분석 실행
         result = analyze_negative_keyword_network(reviews)
         
-        # 결과 출력
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        # 결과 출력 (전체 문자열을 만들지 않고 stdout으로 바로 직렬화, 호출 측은 JSON.parse만 하므로 들여쓰기 생략)
+        if orjson is not None:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+            sys.stdout.buffer.flush()
+        else:
+            json.dump(result, sys.stdout, ensure_ascii=False, separators=(',', ':'))
+            sys.stdout.write('\n')
+            sys.stdout.flush()
         
         # 임시 파일 정리
         try:
@@ -9,6 +9,16 @@ import os
 import tempfile
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 try:
     sys.path.append('server')
     from scraper import analyze_sentiments, extract_korean_words_advanced
@@ -16,6 +26,38 @@ except ImportError as e:
     print(f"Import error: {e}", file=sys.stderr)
     sys.exit(1)
 
+def load_reviews(path):
+    """
+    Load the reviews JSON array written by the server, with orjson when available
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def iter_reviews(path):
+    """
+    Yield reviews from the temp file one at a time
+    
+    With ijson the JSON array is streamed, so only the current review is
+    held in memory; otherwise the whole file is loaded first.
+    """
+    if ijson:
+        with open(path, 'rb') as f:
+            yield from ijson.items(f, 'item')
+    else:
+        yield from load_reviews(path)
+
+def write_result(result):
+    """
+    Write the analysis result to stdout as one line of UTF-8 JSON
+    """
+    if orjson:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(result, ensure_ascii=False))
+
 def main():
     if len(sys.argv) < 3:
         print("Usage: python analyze_reviews.py <temp_file_path> <analysis_type>")
@@ -25,17 +67,19 @@ def main():
     analysis_type = sys.argv[2] if len(sys.argv) > 2 else 'full'
     
     try:
-        # Read reviews from file
-        with open(temp_file_path, 'r', encoding='utf-8') as f:
-            reviews_data = json.load(f)
-        
         if analysis_type == 'wordcloud':
-            # Extract word cloud data only
-            positive_reviews = [r for r in reviews_data if r.get('sentiment') == '긍정']
-            negative_reviews = [r for r in reviews_data if r.get('sentiment') == '부정']
+            # Extract word cloud data only, streaming the reviews and keeping just their texts
+            positive_texts = []
+            negative_texts = []
+            for r in iter_reviews(temp_file_path):
+                sentiment = r.get('sentiment')
+                if sentiment == '긍정':
+                    positive_texts.append(r['content'])
+                elif sentiment == '부정':
+                    negative_texts.append(r['content'])
             
-            positive_words = extract_korean_words_advanced([r['content'] for r in positive_reviews], 'positive', 10) if positive_reviews else []
-            negative_words = extract_korean_words_advanced([r['content'] for r in negative_reviews], 'negative', 10) if negative_reviews else []
+            positive_words = extract_korean_words_advanced(positive_texts, 'positive', 10) if positive_texts else []
+            negative_words = extract_korean_words_advanced(negative_texts, 'negative', 10) if negative_texts else []
             
             result = {
                 'wordCloud': {
@@ -44,14 +88,14 @@ def main():
                 }
             }
         elif analysis_type == 'heart':
-            # Generate HEART insights only
-            result = analyze_sentiments(reviews_data)
+            # Generate HEART insights only (needs every review in memory)
+            result = analyze_sentiments(load_reviews(temp_file_path))
             # Remove word cloud data from result
             if 'wordCloud' in result:
                 del result['wordCloud']
         else:
             # Full analysis (backward compatibility)
-            result = analyze_sentiments(reviews_data)
+            result = analyze_sentiments(load_reviews(temp_file_path))
         
         # Clean up temp file
         try:
@@ -59,7 +103,7 @@ def main():
         except:
             pass
         
-        print(json.dumps(result, ensure_ascii=False))
+        write_result(result)
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
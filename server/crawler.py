@@ -8,426 +8,602 @@ Main crawler module for multi-source review collection
 from service_data import services
 from store_api import crawl_google_play, crawl_apple_store
 from naver_api import search_naver, extract_user_id_from_url
-from datetime import datetime, timedelta
+from naver_cafe_real_date_only import filter_cafe_by_real_date_only, extract_real_date_only
+from datetime import datetime, timezone
+from html import unescape
+from functools import lru_cache
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import random
+import logging
 import re
 
-def crawl_service_by_selection(service_name, selected_channels, start_date=None, end_date=None, review_count=100):
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+logger = logging.getLogger(__name__)
+
+# pandas 벡터화 날짜 필터링을 사용할 최소 항목 수
+VECTORIZE_MIN_ITEMS = 100
+
+# selected_channels에서 인식하는 채널 키
+CHANNELS = frozenset({"googlePlay", "appleStore", "naverBlog", "naverCafe"})
+
+# Service display name -> services key; other names fall back to a lowercased, dashed slug
+_SERVICE_ID_MAP = {
+    '익시오': 'ixio',
+    'SOHO우리가게패키지': 'soho-package',
+    'AI비즈콜': 'ai-bizcall'
+}
+_SPACE_TO_DASH = str.maketrans(' ', '-')
+
+# Naver blog postdate format (YYYYMMDD)
+_POSTDATE_RE = re.compile(r'[0-9]{8}')
+
+# 네이버 검색 결과의 HTML 태그
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 서비스별 키워드 필터 (소문자로 변환한 본문에 적용)
+# '우리가게', '우리 가게'
+_URIGAGE_RE = re.compile(r'우리 ?가게')
+# 'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스', '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
+_SOHO_TELECOM_RE = re.compile(r'lg|l g|유플|유 플러스|uplus|u plus|u ?\+')
+# SOHO 목록에 'u플러스', '유+', '유 +' 추가
+_IXIO_TELECOM_RE = re.compile(r'lg|l g|유플|유 플러스|유 ?\+|uplus|u plus|u플러스|u ?\+')
+# 네이버 카페 뉴스기사 제외 키워드
+_NEWS_RE = re.compile(
+    r'뉴스|기사|보도|press|언론|미디어|기자|취재|신문|방송|편집부|news'
+    r'|속보|단독|특보|일보|타임즈|헤럴드'
+)
+
+def clean_html(text):
     """
-    Crawl reviews from selected channels for a specific service with filtering
+    Strip HTML tags and decode HTML entities in a Naver search snippet
+    """
+    return unescape(_TAG_RE.sub('', text)).strip()
+
+def _normalize_created_at(created_at):
+    """
+    Normalize a store review timestamp to a UTC ISO string ending in Z
+    
+    Any UTC offset (PST -08:00, PDT -07:00, ...) is converted; naive
+    timestamps are taken to be UTC already. Raises ValueError when the
+    timestamp is not ISO 8601.
+    """
+    if not created_at:
+        return created_at
+    
+    parsed = datetime.fromisoformat(created_at)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat().replace('+00:00', 'Z')
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value):
+    """
+    Parse an ISO 8601 string (a trailing Z is accepted), cached per distinct value
+    """
+    return datetime.fromisoformat(value)
+
+@lru_cache(maxsize=4096)
+def _parse_yyyymmdd(value):
+    """
+    Parse an eight-digit YYYYMMDD string, cached per distinct value
+    """
+    return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+
+def _parse_postdate(post_date):
+    """
+    Parse a Naver YYYYMMDD post date, returning None when it is malformed
+    """
+    if not isinstance(post_date, str) or not _POSTDATE_RE.fullmatch(post_date):
+        return None
+    try:
+        return _parse_yyyymmdd(post_date)
+    except ValueError:
+        # Eight digits but not a real calendar date, ex) 20251340
+        return None
+
+def _filter_blogs_by_date(blogs, start_dt, end_dt):
+    """
+    Keep Naver blog items whose postdate falls within [start_dt, end_dt]
+    
+    Large batches are parsed and masked in one vectorized pandas pass;
+    small ones use the plain per-item parser.
     
     Args:
-        service_name: ex) "익시오" or "SOHO우리가게패키지"
-        selected_channels: {
-            "googlePlay": True,
-            "appleStore": True,
-            "naverBlog": False,
-            "naverCafe": True
-        }
-        start_date: Start date for filtering (ISO format)
-        end_date: End date for filtering (ISO format)
-        review_count: Number of reviews to collect per source
+        blogs: Naver blog search result items
+        start_dt: Start date (inclusive)
+        end_dt: End date (inclusive)
         
     Returns:
-        Dictionary with results from each selected channel
+        List of items within the range, in their original order
     """
-    # Map service name to service ID
-    service_mapping = {
-        '익시오': 'ixio',
-        'SOHO우리가게패키지': 'soho-package', 
-        'AI비즈콜': 'ai-bizcall'
-    }
-    service_id = service_mapping.get(service_name, service_name.lower().replace(' ', '-'))
+    if pd is not None and len(blogs) >= VECTORIZE_MIN_ITEMS:
+        # Only postdates _parse_postdate accepts reach pandas, so both paths keep the same items
+        post_dates = [blog.get("postdate", "20250101") for blog in blogs]
+        post_dates = pd.to_datetime(
+            pd.Series([
+                post_date if isinstance(post_date, str) and _POSTDATE_RE.fullmatch(post_date) else None
+                for post_date in post_dates
+            ], dtype=object),
+            format="%Y%m%d",
+            errors="coerce"
+        )
+        mask = post_dates.between(pd.Timestamp(start_dt), pd.Timestamp(end_dt))
+        return [blog for blog, keep in zip(blogs, mask.tolist()) if keep]
     
-    # Check if the mapped service ID exists in the services dictionary
-    if service_id not in services:
-        raise ValueError(f"유효하지 않은 서비스명입니다: {service_name} -> {service_id}")
+    in_range = []
+    for blog in blogs:
+        parsed_date = _parse_postdate(blog.get("postdate", "20250101"))
+        if parsed_date is not None and start_dt <= parsed_date.date() <= end_dt:
+            in_range.append(blog)
+    return in_range
 
-    info = services[service_id]
-    result = {}
+def _store_review_builder(source, label, service_id):
+    """
+    Build a converter from raw store reviews to the standardized review format
     
-    # Get service keywords for filtering
-    service_keywords = info.get("keywords", [service_name])
+    The per-batch constants are bound once in the closure; the review dict
+    itself stays a literal, which CPython builds faster than dict(zip(...)).
     
-    print(f"Crawling {service_name} with filters - Date range: {start_date} to {end_date}, Keywords: {service_keywords}")
-
-    if selected_channels.get("googlePlay"):
-        print(f"Starting Google Play collection for {info['google_play_id']}...")
-        google_reviews = crawl_google_play(
-            info["google_play_id"], 
-            count=1000,  # 더 많은 리뷰를 가져와서 날짜 필터링
-            start_date=start_date,
-            end_date=end_date
-        )
+    Args:
+        source: Source/platform key, ex) "google_play"
+        label: Store name used in log lines, ex) "Google Play"
+        service_id: Service ID to stamp on each review
         
-        print(f"Google Play raw reviews count: {len(google_reviews)}")
+    Returns:
+        Function (i, review, created_at) -> standardized review dictionary
+    """
+    def build(i, review, created_at):
+        store_review = {
+            "userId": review.get("userName", "익명"),
+            "source": source,
+            "serviceId": service_id,
+            "appId": str(i),
+            "rating": review.get("score", 3),
+            "content": review.get("content", ""),
+            "createdAt": created_at,
+            "link": None,
+            "platform": source
+        }
+        logger.debug("  Added %s review %d: %s - %s...", label, i + 1, store_review['userId'], store_review['content'][:50])
+        return store_review
+    
+    return build
+
+def _apple_store_created_at(review):
+    """
+    Normalize an Apple Store review date, falling back to now when it cannot be parsed
+    """
+    created_at = review.get("at", "")
+    if created_at:
+        try:
+            created_at = _normalize_created_at(created_at)
+        except ValueError:
+            # If parsing fails, use current time
+            created_at = datetime.now().isoformat() + 'Z'
+    return created_at
+
+def postprocess_google_play(google_reviews, service_id):
+    """
+    Convert a batch of raw Google Play reviews into the standardized format
+    
+    Args:
+        google_reviews: Iterable of reviews from crawl_google_play
+        service_id: Service ID to stamp on each review
         
-        # Convert Google Play reviews to standardized format
-        google_results = []
-        for i, review in enumerate(google_reviews):
-            # Fix date format - ensure Z suffix for ISO format
-            created_at = review.get("at", "")
-            if created_at and not created_at.endswith('Z'):
-                if '+' not in created_at and '-' not in created_at[-6:]:
-                    created_at += 'Z'
-                elif created_at.endswith('-07:00'):
-                    # Convert PST to UTC
-                    from datetime import datetime as dt_conv, timedelta
-                    dt = dt_conv.fromisoformat(created_at.replace('Z', '+00:00'))
-                    dt = dt + timedelta(hours=7)  # Convert PST to UTC
-                    created_at = dt.isoformat() + 'Z'
-                    
-            google_review = {
-                "userId": review.get("userName", "익명"),
-                "source": "google_play",
-                "serviceId": service_id,
-                "appId": str(i),
-                "rating": review.get("score", 3),
-                "content": review.get("content", ""),
-                "createdAt": created_at,
-                "link": None,
-                "platform": "google_play"
-            }
-            google_results.append(google_review)
-            print(f"  Added Google Play review {i+1}: {google_review['userId']} - {google_review['content'][:50]}...")
+    Returns:
+        List of standardized review dictionaries
+    """
+    build = _store_review_builder("google_play", "Google Play", service_id)
+    # Fix date format - ensure Z suffix for ISO format
+    return [build(i, review, _normalize_created_at(review.get("at", ""))) for i, review in enumerate(google_reviews)]
+
+def postprocess_apple_store(apple_reviews, service_id):
+    """
+    Convert a batch of raw Apple Store reviews into the standardized format
+    
+    Args:
+        apple_reviews: Iterable of reviews from crawl_apple_store
+        service_id: Service ID to stamp on each review
         
-        print(f"Google Play final results count: {len(google_results)}")
-        result["google_play"] = google_results
-
-    if selected_channels.get("appleStore"):
-        print(f"Starting Apple Store collection for {info['apple_store_id']}...")
-        apple_reviews = crawl_apple_store(
-            info["apple_store_id"],
-            count=100,  # 더 많은 리뷰를 가져와서 날짜 필터링
-            start_date=start_date,
-            end_date=end_date
-        )
+    Returns:
+        List of standardized review dictionaries
+    """
+    build = _store_review_builder("apple_store", "Apple Store", service_id)
+    return [build(i, review, _apple_store_created_at(review)) for i, review in enumerate(apple_reviews)]
+
+def _matches_soho(clean_title, clean_description):
+    """
+    SOHO: '우리가게'와 함께 'LG' 또는 '유플러스' 또는 'U+' 언급된 글만
+    """
+    # '우리'가 없는 글이 대부분이므로 본문 결합/소문자 변환 전에 먼저 제외
+    if '우리' not in clean_title and '우리' not in clean_description:
+        return False
+    full_content = (clean_title + " " + clean_description).lower()
+    return _URIGAGE_RE.search(full_content) is not None and _SOHO_TELECOM_RE.search(full_content) is not None
+
+def _matches_ixio(clean_title, clean_description):
+    """
+    익시오: 'LG', 'U+', '유플러스', '유+', 'uplus' 키워드가 함께 있는 글만
+    """
+    full_content = (clean_title + " " + clean_description).lower()
+    return _IXIO_TELECOM_RE.search(full_content) is not None
+
+# 서비스명 -> (필터 함수, 로그 라벨, 제외 사유, 포함 사유); 없는 서비스는 필터링하지 않음
+_SERVICE_FILTERS = {
+    "SOHO우리가게패키지": (_matches_soho, "SOHO", "키워드 불일치", "키워드 일치"),
+    "익시오": (_matches_ixio, "익시오", "통신사 키워드 없음", "통신사 키워드 발견")
+}
+
+def _submit_naver_searches(keywords, **search_kwargs):
+    """
+    Run search_naver for every keyword at once so the request round trips overlap
+    
+    Args:
+        keywords: Search keywords
+        search_kwargs: Keyword arguments passed through to search_naver
         
-        print(f"Apple Store raw reviews count: {len(apple_reviews)}")
+    Returns:
+        List of (keyword, Future) pairs in keyword order; Future.result()
+        returns the items or re-raises the search error
+    """
+    with ThreadPoolExecutor(max_workers=max(len(keywords), 1), thread_name_prefix="naver-search") as executor:
+        return [(kw, executor.submit(search_naver, kw, **search_kwargs)) for kw in keywords]
+
+def _crawl_google_play_channel(info, service_id, start_date, end_date):
+    """
+    Collect and standardize Google Play reviews for one service
+    """
+    logger.info("Starting Google Play collection for %s...", info['google_play_id'])
+    google_reviews = crawl_google_play(
+        info["google_play_id"], 
+        count=1000,  # 더 많은 리뷰를 가져와서 날짜 필터링
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    # Convert Google Play reviews to standardized format while streaming
+    google_results = postprocess_google_play(google_reviews, service_id)
+    
+    logger.info("Google Play final results count: %d", len(google_results))
+    return google_results
+
+def _crawl_apple_store_channel(info, service_id, start_date, end_date):
+    """
+    Collect and standardize Apple Store reviews for one service
+    """
+    logger.info("Starting Apple Store collection for %s...", info['apple_store_id'])
+    apple_reviews = crawl_apple_store(
+        info["apple_store_id"],
+        count=100,  # 더 많은 리뷰를 가져와서 날짜 필터링
+        start_date=start_date,
+        end_date=end_date
+    )
+    
+    logger.info("Apple Store raw reviews count: %d", len(apple_reviews))
+    
+    # Convert Apple Store reviews to standardized format
+    apple_results = postprocess_apple_store(apple_reviews, service_id)
+    
+    logger.info("Apple Store final results count: %d", len(apple_results))
+    return apple_results
+
+def _crawl_naver_blog_channel(service_name, service_id, blog_keywords, start_date, end_date, review_count):
+    """
+    Collect Naver Blog posts for one service, filtered by date and service keywords
+    """
+    logger.info("Starting Naver Blog collection...")
+    # 서비스별 필터는 호출마다 한 번만 선택
+    service_filter = _SERVICE_FILTERS.get(service_name)
+    blog_results = []
+    try:
+        # Filter by date range if specified (date only comparison)
+        if start_date and end_date:
+            start_dt = _parse_iso(start_date).date()
+            end_dt = _parse_iso(end_date).date()
         
-        # Convert Apple Store reviews to standardized format
-        apple_results = []
-        for i, review in enumerate(apple_reviews):
-            # Fix date format - ensure proper ISO format
-            created_at = review.get("at", "")
-            if created_at:
-                try:
-                    from datetime import datetime as dt_conv, timedelta
-                    if '-07:00' in created_at:
-                        # Convert PST to UTC
-                        dt = dt_conv.fromisoformat(created_at.replace('-07:00', ''))
-                        dt = dt + timedelta(hours=7)  # Convert PST to UTC
-                        created_at = dt.isoformat() + 'Z'
-                    elif not created_at.endswith('Z') and '+' not in created_at:
-                        created_at += 'Z'
-                except:
-                    # If parsing fails, use current time
-                    created_at = dt_conv.now().isoformat() + 'Z'
+        # 네이버 API 사용 시도
+        api_success = False
+        searches = _submit_naver_searches(blog_keywords, search_type="blog", display=review_count//3, start_date=start_date, end_date=end_date)
+        for kw, search in searches:
+            logger.info("Searching Naver Blog with keyword: %s", kw)
+            try:
+                naver_blogs = search.result()
+                logger.info("Found %d blog results for keyword: %s", len(naver_blogs), kw)
+                
+                if naver_blogs:
+                    api_success = True
                     
-            apple_review = {
-                "userId": review.get("userName", "익명"),
-                "source": "apple_store",
-                "serviceId": service_id,
-                "appId": str(i),
-                "rating": review.get("score", 3),
-                "content": review.get("content", ""),
-                "createdAt": created_at,
-                "link": None,
-                "platform": "apple_store"
-            }
-            apple_results.append(apple_review)
-            print(f"  Added Apple Store review {i+1}: {apple_review['userId']} - {apple_review['content'][:50]}...")
+                    # Drop posts outside the date range (or with unparseable dates) in one pass
+                    if start_date and end_date:
+                        in_range_blogs = _filter_blogs_by_date(naver_blogs, start_dt, end_dt)
+                        logger.debug("  Skipping %d blog posts outside range %s to %s", len(naver_blogs) - len(in_range_blogs), start_dt, end_dt)
+                        naver_blogs = in_range_blogs
+                    
+                    # Convert to review format
+                    for blog in naver_blogs:
+                        # Convert YYYYMMDD to ISO format
+                        parsed_date = _parse_postdate(blog.get("postdate", "20250101"))
+                        if parsed_date is None:
+                            iso_date = "2025-01-01T00:00:00Z"
+                        else:
+                            iso_date = parsed_date.isoformat() + "Z"
+                        
+                        # Clean content from HTML tags
+                        title = blog.get("title", "")
+                        description = blog.get("description", "")
+                        
+                        # Remove HTML tags and entities from content
+                        clean_title = clean_html(title)
+                        clean_description = clean_html(description)
+                        
+                        # 서비스별 특별 필터링
+                        if service_filter is not None:
+                            matches, label, rejected, accepted = service_filter
+                            if not matches(clean_title, clean_description):
+                                logger.debug("  ❌ %s 블로그 제외 (%s): %s...", label, rejected, clean_title[:50])
+                                continue
+                            
+                            logger.debug("  ✅ %s 블로그 포함 (%s): %s...", label, accepted, clean_title[:30])
+                        
+                        # Extract user ID from URL
+                        user_id = extract_user_id_from_url(
+                            blog.get("bloggerlink", ""),
+                            blog.get("link", ""),
+                            "blog"
+                        ) or blog.get("bloggername", "Unknown")
+                        
+                        blog_review = {
+                            "userId": user_id,
+                            "source": "naver_blog",
+                            "serviceId": service_id,
+                            "appId": f"blog_{blog.get('postdate', 'unknown')}",
+                            "rating": 5,  # Default rating for blog posts
+                            "content": f"{clean_title} {clean_description}",
+                            "createdAt": iso_date,
+                            "link": blog.get("link", ""),
+                            "platform": "naver_blog"
+                        }
+                        blog_results.append(blog_review)
+                        logger.debug("Added blog review from %s: %s...", blog_review['userId'], blog_review['content'][:50])
+            
+            except Exception as e:
+                logger.warning("Error searching Naver Blog with keyword %s: %s", kw, e)
+                continue
         
-        print(f"Apple Store final results count: {len(apple_results)}")
-        result["apple_store"] = apple_results
-
-    if selected_channels.get("naverBlog"):
-        print("Starting Naver Blog collection...")
+        # 네이버 API 실패 시 빈 결과 반환
+        if not api_success or len(blog_results) == 0:
+            logger.warning("네이버 블로그 API 실패 - 유효한 API 키가 필요합니다")
+            blog_results = []
+            
+        logger.info("Total blog results collected: %d", len(blog_results))
+    except Exception as e:
+        logger.warning("Error collecting Naver Blog reviews: %s", e)
         blog_results = []
-        try:
-            # 네이버 API 사용 시도
-            api_success = False
-            for kw in service_keywords[:3]:  # Limit to top 3 keywords
-                print(f"Searching Naver Blog with keyword: {kw}")
-                try:
-                    naver_blogs = search_naver(kw, search_type="blog", display=review_count//3, start_date=start_date, end_date=end_date)
-                    print(f"Found {len(naver_blogs)} blog results for keyword: {kw}")
+    return blog_results
+
+def _crawl_naver_cafe_channel(service_name, service_id, cafe_keywords, start_date, end_date):
+    """
+    Collect Naver Cafe posts for one service, filtered by date and service keywords
+    """
+    logger.info("Starting Naver Cafe collection...")
+    # 서비스별 필터는 호출마다 한 번만 선택
+    service_filter = _SERVICE_FILTERS.get(service_name)
+    cafe_results = []
+    try:
+        # 네이버 API 사용 시도
+        api_success = False
+        searches = _submit_naver_searches(cafe_keywords, search_type="cafe", display=100, start_date=start_date, end_date=end_date)  # 최대 100개로 확장
+        for kw, search in searches:
+            logger.info("Searching Naver Cafe with keyword: %s", kw)
+            try:
+                naver_cafes = search.result()
+                logger.info("Found %d cafe results for keyword: %s", len(naver_cafes), kw)
+                
+                if naver_cafes:
+                    api_success = True
                     
-                    if naver_blogs:
-                        api_success = True
-                        # Convert to review format
-                        for blog in naver_blogs:
-                            # Convert YYYYMMDD to ISO format
-                            post_date = blog.get("postdate", "20250101")
-                            try:
-                                from datetime import datetime as dt_parse
-                                parsed_date = dt_parse.strptime(post_date, "%Y%m%d")
-                                iso_date = parsed_date.isoformat() + "Z"
-                                
-                                # Filter by date range if specified (date only comparison)
-                                if start_date and end_date:
-                                    start_dt = dt_parse.fromisoformat(start_date.replace('Z', '+00:00')).replace(tzinfo=None).date()
-                                    end_dt = dt_parse.fromisoformat(end_date.replace('Z', '+00:00')).replace(tzinfo=None).date()
-                                    blog_date = parsed_date.date()
-                                    if not (start_dt <= blog_date <= end_dt):
-                                        print(f"  Skipping blog post: {blog_date} outside range {start_dt} to {end_dt}")
-                                        continue  # Skip this review if outside date range
-                            except:
-                                # Skip if we can't parse the date and date filtering is required
-                                if start_date and end_date:
-                                    print(f"  Skipping blog post: unparseable date {post_date}")
-                                    continue
-                                else:
-                                    iso_date = "2025-01-01T00:00:00Z"
+                    # 날짜 필터링 적용 - 실제 날짜만 추출 시스템 사용 (추정치 없음)
+                    if start_date and end_date:
+                        try:
+                            # ISO 날짜를 date 객체로 변환
+                            start_dt = _parse_iso(start_date).date()
+                            end_dt = _parse_iso(end_date).date()
+                            
+                            logger.info("  실제 날짜만 추출 시스템 사용: %s ~ %s", start_dt, end_dt)
                             
-                            # Clean content from HTML tags
-                            title = blog.get("title", "")
-                            description = blog.get("description", "")
+                            # 빠른 날짜 필터링 (속도 최적화)
+                            filtered_results = filter_cafe_by_real_date_only(
+                                naver_cafes, 
+                                start_dt, 
+                                end_dt, 
+                                service_name=service_name,
+                                max_results=30  # 속도를 위해 30개로 조정
+                            )
                             
-                            # Remove HTML tags from content
-                            def clean_html(text):
-                                # Remove HTML tags
-                                import re
-                                text = re.sub(r'<[^>]+>', '', text)
-                                # Decode HTML entities
-                                text = text.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                                text = text.replace('&quot;', '"').replace('&#39;', "'")
-                                return text.strip()
+                            cafe_results.extend(filtered_results)
+                            logger.info("  실제 날짜 추출 성공: %d개 카페 리뷰 수집", len(filtered_results))
                             
+                        except Exception as e:
+                            logger.warning("  실제 날짜 추출 오류: %s - 웹 스크래핑, URL 패턴 분석 등 모든 실제 날짜 추출 방법 실패", e)
+                            logger.debug("Cafe real-date filtering failed", exc_info=True)
+                    else:
+                        # 날짜 필터링 없는 경우 모든 카페 글 수집
+                        for cafe in naver_cafes:
+                            # 뉴스기사 필터링 체크 (네이버 카페에서 뉴스기사 제외)
+                            title = cafe.get("title", "")
+                            description = cafe.get("description", "")
+                            text_content = (title + " " + description).lower()
+                            
+                            # 뉴스기사 제외 키워드 체크
+                            if _NEWS_RE.search(text_content):
+                                logger.debug("  Skipping news article: %s...", title[:50])
+                                continue
+                            
+                            # Clean content from HTML tags and entities first
                             clean_title = clean_html(title)
                             clean_description = clean_html(description)
                             
-                            # 서비스별 특별 필터링
-                            if service_name == "SOHO우리가게패키지":
-                                # SOHO: '우리가게'와 함께 'LG' 또는 '유플러스' 또는 'U+' 언급된 글만
-                                full_content = (clean_title + " " + clean_description).lower()
-                                
-                                # '우리가게' 키워드 체크
-                                has_우리가게 = any(keyword in full_content for keyword in ['우리가게', '우리 가게'])
-                                
-                                # 'LG' 또는 '유플러스' 또는 'U+' 키워드 체크
-                                has_lg_or_uplus = any(keyword in full_content for keyword in [
-                                    'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                                    '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
-                                ])
-                                
-                                if not (has_우리가게 and has_lg_or_uplus):
-                                    print(f"  ❌ SOHO 블로그 제외 (키워드 불일치): {clean_title[:50]}...")
-                                    continue
+                            # 확실한 카페 날짜만 추출 (추정 금지)
+                            extracted_date = extract_real_date_only(cafe)
+                            if extracted_date is None:
+                                logger.debug("  ❌ 확실한 날짜 없음 - 카페 글 제외: %s...", clean_title[:30])
+                                continue
                                 
-                                print(f"  ✅ SOHO 블로그 포함 (키워드 일치): {clean_title[:30]}...")
+                            iso_date = extracted_date.strftime('%Y-%m-%dT00:00:00.000Z')
+                            logger.debug("  ✓ 네이버 카페 확실한 날짜: %s -> %s", extracted_date, iso_date)
                             
-                            elif service_name == "익시오":
-                                # 익시오: 'LG', 'U+', '유플러스', '유+', 'uplus' 키워드가 함께 있는 글만
-                                full_content = (clean_title + " " + clean_description).lower()
-                                
-                                # 통신사 키워드 체크
-                                has_telecom_keywords = any(keyword in full_content for keyword in [
-                                    'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                                    'u+', 'u +', 'u플러스', 'uplus', 'u plus',
-                                    '유플러스', '유 플러스', '유플', '유+', '유 +'
-                                ])
-                                
-                                if not has_telecom_keywords:
-                                    print(f"  ❌ 익시오 블로그 제외 (통신사 키워드 없음): {clean_title[:50]}...")
+                            # 서비스별 특별 필터링
+                            if service_filter is not None:
+                                matches, label, rejected, accepted = service_filter
+                                if not matches(clean_title, clean_description):
+                                    logger.debug("  ❌ %s 카페 제외 (%s): %s...", label, rejected, clean_title[:50])
                                     continue
                                 
-                                print(f"  ✅ 익시오 블로그 포함 (통신사 키워드 발견): {clean_title[:30]}...")
+                                logger.debug("  ✅ %s 카페 포함 (%s): %s...", label, accepted, clean_title[:30])
                             
-                            # Extract user ID from URL
-                            user_id = extract_user_id_from_url(
-                                blog.get("bloggerlink", ""),
-                                blog.get("link", ""),
-                                "blog"
-                            ) or blog.get("bloggername", "Unknown")
-                            
-                            blog_review = {
-                                "userId": user_id,
-                                "source": "naver_blog",
+                            cafe_review = {
+                                "userId": cafe.get("extracted_user_id") or cafe.get("cafename", "Unknown"),
+                                "source": "naver_cafe",
                                 "serviceId": service_id,
-                                "appId": f"blog_{blog.get('postdate', 'unknown')}",
-                                "rating": 5,  # Default rating for blog posts
-                                "content": f"{clean_title} {clean_description}",
-                                "createdAt": iso_date,
-                                "link": blog.get("link", ""),
-                                "platform": "naver_blog"
+                                "appId": f"cafe_{cafe.get('cafename', 'unknown')}",
+                                "rating": 5,  # Default rating for cafe posts
+                                "content": f"{clean_title} {clean_description}".strip(),
+                                "createdAt": iso_date,  # Use current date
+                                "link": cafe.get("link", ""),
+                                "platform": "naver_cafe"
                             }
-                            blog_results.append(blog_review)
-                            print(f"Added blog review from {blog_review['userId']}: {blog_review['content'][:50]}...")
-                
-                except Exception as e:
-                    print(f"Error searching Naver Blog with keyword {kw}: {e}")
-                    continue
-            
-            # 네이버 API 실패 시 빈 결과 반환
-            if not api_success or len(blog_results) == 0:
-                print("네이버 블로그 API 실패 - 유효한 API 키가 필요합니다")
-                blog_results = []
-                
-            print(f"Total blog results collected: {len(blog_results)}")
-        except Exception as e:
-            print(f"Error collecting Naver Blog reviews: {str(e)}")
-            blog_results = []
-        result["naver_blog"] = blog_results
-
-    if selected_channels.get("naverCafe"):
-        print("Starting Naver Cafe collection...")
-        cafe_results = []
-        try:
-            # 네이버 API 사용 시도
-            api_success = False
-            for kw in service_keywords[:5]:  # 키워드 수 확장 (3→5개)
-                print(f"Searching Naver Cafe with keyword: {kw}")
-                try:
-                    naver_cafes = search_naver(kw, search_type="cafe", display=100, start_date=start_date, end_date=end_date)  # 최대 100개로 확장
-                    print(f"Found {len(naver_cafes)} cafe results for keyword: {kw}")
-                    
-                    if naver_cafes:
-                        api_success = True
-                        
-                        # 날짜 필터링 적용 - 실제 날짜만 추출 시스템 사용 (추정치 없음)
-                        if start_date and end_date:
-                            try:
-                                from naver_cafe_real_date_only import filter_cafe_by_real_date_only
-                                from datetime import datetime as dt_parser
-                                
-                                # ISO 날짜를 date 객체로 변환
-                                start_dt = dt_parser.fromisoformat(start_date.replace('Z', '+00:00')).date()
-                                end_dt = dt_parser.fromisoformat(end_date.replace('Z', '+00:00')).date()
-                                
-                                print(f"  실제 날짜만 추출 시스템 사용: {start_dt} ~ {end_dt}")
-                                
-                                # 빠른 날짜 필터링 (속도 최적화)
-                                filtered_results = filter_cafe_by_real_date_only(
-                                    naver_cafes, 
-                                    start_dt, 
-                                    end_dt, 
-                                    service_name=service_name,
-                                    max_results=30  # 속도를 위해 30개로 조정
-                                )
-                                
-                                cafe_results.extend(filtered_results)
-                                print(f"  실제 날짜 추출 성공: {len(filtered_results)}개 카페 리뷰 수집")
-                                
-                            except Exception as e:
-                                print(f"  실제 날짜 추출 오류: {e}")
-                                print(f"  웹 스크래핑, URL 패턴 분석 등 모든 실제 날짜 추출 방법 실패")
-                                import traceback
-                                traceback.print_exc()
-                        else:
-                            # 날짜 필터링 없는 경우 모든 카페 글 수집
-                            for cafe in naver_cafes:
-                                # 뉴스기사 필터링 체크 (네이버 카페에서 뉴스기사 제외)
-                                title = cafe.get("title", "")
-                                description = cafe.get("description", "")
-                                text_content = (title + " " + description).lower()
-                                
-                                # 뉴스기사 제외 키워드 체크
-                                news_indicators = [
-                                    "뉴스", "기사", "보도", "보도자료", "press", "뉴스기사", "언론", "미디어", 
-                                    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
-                                    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드"
-                                ]
-                                
-                                if any(indicator in text_content for indicator in news_indicators):
-                                    print(f"  Skipping news article: {title[:50]}...")
-                                    continue
-                                
-                                # 실제 네이버 카페 날짜 추출 (확실한 데이터만)
-                                from datetime import datetime as dt
-                                from naver_cafe_real_date_only import extract_real_date_only
-                                
-                                # Clean content from HTML tags first
-                                clean_title = re.sub(r'<[^>]+>', '', title)
-                                clean_description = re.sub(r'<[^>]+>', '', description)
-                                
-                                # 확실한 카페 날짜만 추출 (추정 금지)
-                                extracted_date = extract_real_date_only(cafe)
-                                if extracted_date is None:
-                                    print(f"  ❌ 확실한 날짜 없음 - 카페 글 제외: {clean_title[:30]}...")
-                                    continue
-                                    
-                                iso_date = extracted_date.strftime('%Y-%m-%dT00:00:00.000Z')
-                                print(f"  ✓ 네이버 카페 확실한 날짜: {extracted_date} -> {iso_date}")
-                                
-                                # Decode HTML entities
-                                clean_title = clean_title.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                                clean_title = clean_title.replace('&quot;', '"').replace('&#39;', "'")
-                                clean_description = clean_description.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                                clean_description = clean_description.replace('&quot;', '"').replace('&#39;', "'")
-                                
-                                # 서비스별 특별 필터링
-                                if service_name == "SOHO우리가게패키지":
-                                    # SOHO: '우리가게'와 함께 'LG' 또는 '유플러스' 또는 'U+' 언급된 글만
-                                    full_content = (clean_title + " " + clean_description).lower()
-                                    
-                                    # '우리가게' 키워드 체크
-                                    has_우리가게 = any(keyword in full_content for keyword in ['우리가게', '우리 가게'])
-                                    
-                                    # 'LG' 또는 '유플러스' 또는 'U+' 키워드 체크
-                                    has_lg_or_uplus = any(keyword in full_content for keyword in [
-                                        'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                                        '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
-                                    ])
-                                    
-                                    if not (has_우리가게 and has_lg_or_uplus):
-                                        print(f"  ❌ SOHO 카페 제외 (키워드 불일치): {clean_title[:50]}...")
-                                        continue
-                                        
-                                    print(f"  ✅ SOHO 카페 포함 (키워드 일치): {clean_title[:30]}...")
-                                
-                                elif service_name == "익시오":
-                                    # 익시오: 'LG', 'U+', '유플러스', '유+', 'uplus' 키워드가 함께 있는 글만
-                                    full_content = (clean_title + " " + clean_description).lower()
-                                    
-                                    # 통신사 키워드 체크
-                                    has_telecom_keywords = any(keyword in full_content for keyword in [
-                                        'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                                        'u+', 'u +', 'u플러스', 'uplus', 'u plus',
-                                        '유플러스', '유 플러스', '유플', '유+', '유 +'
-                                    ])
-                                    
-                                    if not has_telecom_keywords:
-                                        print(f"  ❌ 익시오 카페 제외 (통신사 키워드 없음): {clean_title[:50]}...")
-                                        continue
-                                    
-                                    print(f"  ✅ 익시오 카페 포함 (통신사 키워드 발견): {clean_title[:30]}...")
-                                    
-                                    print(f"  ✅ 카페 포함 (키워드 일치): {clean_title[:30]}...")
-                                
-                                cafe_review = {
-                                    "userId": cafe.get("extracted_user_id") or cafe.get("cafename", "Unknown"),
-                                    "source": "naver_cafe",
-                                    "serviceId": service_id,
-                                    "appId": f"cafe_{cafe.get('cafename', 'unknown')}",
-                                    "rating": 5,  # Default rating for cafe posts
-                                    "content": f"{clean_title} {clean_description}".strip(),
-                                    "createdAt": iso_date,  # Use current date
-                                    "link": cafe.get("link", ""),
-                                    "platform": "naver_cafe"
-                                }
-                                cafe_results.append(cafe_review)
-                                print(f"Added cafe review from {cafe_review['userId']}: {cafe_review['content'][:50]}...")
-                except Exception as e:
-                    print(f"Error searching cafe with keyword {kw}: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
-            
-            # 네이버 API 실패 시 빈 결과 반환
-            if not api_success or len(cafe_results) == 0:
-                print("네이버 API 실패 - 유효한 API 키가 필요합니다")
-                cafe_results = []
-            
-            print(f"Total cafe results collected: {len(cafe_results)}")
-        except Exception as e:
-            print(f"Error collecting Naver Cafe reviews: {str(e)}")
-            import traceback
-            traceback.print_exc()
+                            cafe_results.append(cafe_review)
+                            logger.debug("Added cafe review from %s: %s...", cafe_review['userId'], cafe_review['content'][:50])
+            except Exception as e:
+                logger.warning("Error searching cafe with keyword %s: %s", kw, e)
+                logger.debug("Cafe search failed for keyword %s", kw, exc_info=True)
+                continue
+        
+        # 네이버 API 실패 시 빈 결과 반환
+        if not api_success or len(cafe_results) == 0:
+            logger.warning("네이버 API 실패 - 유효한 API 키가 필요합니다")
             cafe_results = []
-        result["naver_cafe"] = cafe_results
+        
+        logger.info("Total cafe results collected: %d", len(cafe_results))
+    except Exception as e:
+        logger.warning("Error collecting Naver Cafe reviews: %s", e)
+        logger.debug("Naver Cafe collection failed", exc_info=True)
+        cafe_results = []
+    return cafe_results
+
+async def crawl_service_by_selection_async(service_name, selected_channels, start_date=None, end_date=None, review_count=100):
+    """
+    Crawl reviews from selected channels for a specific service with filtering
+    
+    Args:
+        service_name: ex) "익시오" or "SOHO우리가게패키지"
+        selected_channels: {
+            "googlePlay": True,
+            "appleStore": True,
+            "naverBlog": False,
+            "naverCafe": True
+        }
+        start_date: Start date for filtering (ISO format)
+        end_date: End date for filtering (ISO format)
+        review_count: Number of reviews to collect per source
+        
+    Returns:
+        Dictionary with results from each selected channel; a channel that
+        fails outright is reported and returned as an empty list
+    """
+    # Map service name to service ID
+    service_id = _SERVICE_ID_MAP.get(service_name) or service_name.lower().translate(_SPACE_TO_DASH)
+    
+    # Check if the mapped service ID exists in the services dictionary
+    if service_id not in services:
+        raise ValueError(f"유효하지 않은 서비스명입니다: {service_name} -> {service_id}")
+
+    info = services[service_id]
+    
+    # Get service keywords for filtering
+    service_keywords = info.get("keywords", [service_name])
+    blog_keywords = service_keywords[:3]  # Limit to top 3 keywords
+    cafe_keywords = service_keywords[:5]  # 키워드 수 확장 (3→5개)
+    
+    # Resolve the enabled channels once and flag unknown keys up front
+    enabled_channels = {channel for channel, selected in selected_channels.items() if selected}
+    unknown_channels = enabled_channels - CHANNELS
+    if unknown_channels:
+        print(f"Ignoring unknown channels: {sorted(unknown_channels)}")
+    
+    print(f"Crawling {service_name} with filters - Date range: {start_date} to {end_date}, Keywords: {service_keywords}")
 
+    # Every channel is network-bound and independent, so run them side by side
+    jobs = {}
+    if "googlePlay" in enabled_channels:
+        jobs["google_play"] = (_crawl_google_play_channel, info, service_id, start_date, end_date)
+    if "appleStore" in enabled_channels:
+        jobs["apple_store"] = (_crawl_apple_store_channel, info, service_id, start_date, end_date)
+    if "naverBlog" in enabled_channels:
+        jobs["naver_blog"] = (_crawl_naver_blog_channel, service_name, service_id, blog_keywords, start_date, end_date, review_count)
+    if "naverCafe" in enabled_channels:
+        jobs["naver_cafe"] = (_crawl_naver_cafe_channel, service_name, service_id, cafe_keywords, start_date, end_date)
+    
+    # One thread per channel in a pool owned by this crawl, so concurrent
+    # service crawls never queue behind each other in the shared default executor
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max(len(jobs), 1), thread_name_prefix=f"crawl-{service_id}") as executor:
+        channel_results = await asyncio.gather(
+            *(loop.run_in_executor(executor, *job) for job in jobs.values()),
+            return_exceptions=True
+        )
+    
+    # Channels log their progress through the module logger while they run;
+    # the per-channel summary is printed here, one line each, in channel order
+    result = {}
+    for source, channel_result in zip(jobs, channel_results):
+        if isinstance(channel_result, Exception):
+            print(f"Error collecting {source} reviews: {channel_result}")
+            channel_result = []
+        result[source] = channel_result
+        print(f"{source} results collected: {len(channel_result)}")
     return result
 
+def crawl_service_by_selection(service_name, selected_channels, start_date=None, end_date=None, review_count=100):
+    """
+    Synchronous wrapper around crawl_service_by_selection_async for existing callers
+    """
+    return asyncio.run(crawl_service_by_selection_async(service_name, selected_channels, start_date, end_date, review_count))
+
+async def crawl_services_by_selection_async(service_names, selected_channels, start_date=None, end_date=None, review_count=100):
+    """
+    Crawl several services concurrently with the same channel selection and filters
+    
+    Args:
+        service_names: List of service names, ex) ["익시오", "AI비즈콜"]
+        selected_channels: Same shape as crawl_service_by_selection
+        start_date: Start date for filtering (ISO format)
+        end_date: End date for filtering (ISO format)
+        review_count: Number of reviews to collect per source
+        
+    Returns:
+        Dictionary mapping each service name to its channel results,
+        or to the exception raised while crawling that service
+    """
+    results = await asyncio.gather(
+        *(crawl_service_by_selection_async(name, selected_channels, start_date, end_date, review_count) for name in service_names),
+        return_exceptions=True
+    )
+    for name, service_result in zip(service_names, results):
+        if isinstance(service_result, Exception):
+            print(f"Error crawling service {name}: {service_result}")
+    return dict(zip(service_names, results))
+
+def crawl_services_by_selection(service_names, selected_channels, start_date=None, end_date=None, review_count=100):
+    """
+    Synchronous wrapper around crawl_services_by_selection_async
+    """
+    return asyncio.run(crawl_services_by_selection_async(service_names, selected_channels, start_date, end_date, review_count))
+
 
 # Google Play and Apple Store functions are now imported from store_api.py
\ No newline at end of file
@@ -4,11 +4,51 @@ URL 패턴과 다중 접근법을 통한 실제 날짜 추출
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import re
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 from urllib.parse import urlparse, parse_qs
 import json
-import time
+import codecs
+from bisect import bisect_left
+
+from naver_api import strip_html
+from naver_cafe_real_date_simple import get_cafe_date_with_fallback
+
+# 카페 페이지마다 새 TCP/TLS 연결을 맺지 않도록 커넥션 풀을 공유하는 세션
+_session = requests.Session()
+_session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+})
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+# URL의 articleid / 경로 숫자(게시물 번호) 추출 패턴
+_ARTICLE_ID_RE = re.compile(r'articleid=(\d+)')
+_PATH_NUMBER_RE = re.compile(r'/(\d+)')
+
+# articleid 기반 날짜 추정 구간 (articleid가 THRESHOLDS[i-1]보다 크고 THRESHOLDS[i] 이하이면 DATES[i], 큰 숫자일수록 최근)
+_ARTICLE_ID_THRESHOLDS = (
+    7000000, 7500000, 8000000, 8200000, 8300000, 8400000, 8500000, 8600000, 8700000, 8800000
+)
+_ARTICLE_ID_DATES = (
+    date(2022, 7, 1),   # 2022년
+    date(2023, 7, 1),   # 2023년
+    date(2024, 4, 1),   # 2024년 상반기
+    date(2024, 10, 1),  # 2024년 하반기
+    date(2025, 1, 15),  # 2025년 1월
+    date(2025, 2, 15),  # 2025년 2월
+    date(2025, 3, 15),  # 2025년 3월
+    date(2025, 4, 15),  # 2025년 4월
+    date(2025, 5, 15),  # 2025년 5월
+    date(2025, 6, 15),  # 2025년 6월
+    date(2025, 7, 10),  # 2025년 7월 이후
+)
+
+# URL 게시물 번호 기반 날짜 추정 구간 (같은 방식)
+_POST_NUM_THRESHOLDS = (7000000, 8000000)
+_POST_NUM_DATES = (date(2023, 7, 1), date(2024, 7, 1), date(2025, 7, 1))
 
 def extract_date_from_url_pattern(cafe_url):
     """
@@ -18,52 +58,66 @@ def extract_date_from_url_pattern(cafe_url):
         # URL에서 articleid 추출
         if 'articleid=' in cafe_url:
             # articleid 기반 추정 (큰 숫자일수록 최근)
-            article_id = re.search(r'articleid=(\d+)', cafe_url)
+            article_id = _ARTICLE_ID_RE.search(cafe_url)
             if article_id:
                 article_num = int(article_id.group(1))
-                # 더 정확한 날짜 추정 (articleid 기반)
-                if article_num > 8800000:  # 2025년 7월 이후
-                    estimated_date = datetime(2025, 7, 10)
-                elif article_num > 8700000:  # 2025년 6월
-                    estimated_date = datetime(2025, 6, 15)
-                elif article_num > 8600000:  # 2025년 5월
-                    estimated_date = datetime(2025, 5, 15)
-                elif article_num > 8500000:  # 2025년 4월
-                    estimated_date = datetime(2025, 4, 15)
-                elif article_num > 8400000:  # 2025년 3월
-                    estimated_date = datetime(2025, 3, 15)
-                elif article_num > 8300000:  # 2025년 2월
-                    estimated_date = datetime(2025, 2, 15)
-                elif article_num > 8200000:  # 2025년 1월
-                    estimated_date = datetime(2025, 1, 15)
-                elif article_num > 8000000:  # 2024년 하반기
-                    estimated_date = datetime(2024, 10, 1)
-                elif article_num > 7500000:  # 2024년 상반기
-                    estimated_date = datetime(2024, 4, 1)
-                elif article_num > 7000000:  # 2023년
-                    estimated_date = datetime(2023, 7, 1)
-                else:
-                    estimated_date = datetime(2022, 7, 1)
-                
-                return estimated_date.date()
+                # 더 정확한 날짜 추정 (articleid 기반, 구간 경계 초과 여부를 이진 탐색)
+                return _ARTICLE_ID_DATES[bisect_left(_ARTICLE_ID_THRESHOLDS, article_num)]
         
         # URL에서 숫자 패턴 추출 (게시물 번호)
-        numbers = re.findall(r'/(\d+)', cafe_url)
+        numbers = _PATH_NUMBER_RE.findall(cafe_url)
         if numbers:
             post_num = int(numbers[-1])  # 마지막 숫자가 보통 게시물 번호
             # 게시물 번호 기반 추정
-            if post_num > 8000000:
-                return datetime(2025, 7, 1).date()
-            elif post_num > 7000000:
-                return datetime(2024, 7, 1).date()
-            else:
-                return datetime(2023, 7, 1).date()
+            return _POST_NUM_DATES[bisect_left(_POST_NUM_THRESHOLDS, post_num)]
         
         return None
     except Exception as e:
         print(f"    URL 패턴 분석 오류: {e}")
         return None
 
+# 네이버 카페 페이지 날짜 패턴들 (앞쪽 패턴 우선, 모듈 로드 시 한 번만 컴파일)
+_CAFE_PAGE_DATE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in [
+    # JSON 데이터에서 날짜 추출
+    r'"writeDate":"([^"]+)"',
+    r'"regDate":"([^"]+)"', 
+    r'"date":"(\d{4}\.\d{1,2}\.\d{1,2})"',
+    r'"created":"(\d{4}-\d{1,2}-\d{1,2})"',
+    # HTML에서 날짜 패턴
+    r'작성일[:\s]*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',
+    r'등록일[:\s]*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',
+    r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\s*\d{1,2}:\d{1,2}',
+    # 다양한 형식의 날짜
+    r'(\d{4})-(\d{1,2})-(\d{1,2})',
+    r'(\d{2})\.(\d{1,2})\.(\d{1,2})',
+    # 메타 데이터에서
+    r'<meta[^>]*content="([^"]*\d{4}-\d{1,2}-\d{1,2}[^"]*)"',
+    # 시간 정보 포함
+    r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일',
+])
+
+def read_text_prefix(response, max_chars):
+    """
+    스트리밍 응답에서 앞부분 max_chars 글자만 디코딩 (response.text[:max_chars]와 같은 결과)
+    """
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    
+    parts = []
+    length = 0
+    for chunk in response.iter_content(chunk_size=4096):
+        text = decoder.decode(chunk)
+        parts.append(text)
+        length += len(text)
+        if length >= max_chars:
+            break
+    else:
+        parts.append(decoder.decode(b'', final=True))
+    
+    return ''.join(parts)[:max_chars]
+
 def extract_actual_date_from_cafe_page(cafe_url):
     """
     네이버 카페 실제 페이지에서 작성 날짜 추출
@@ -71,113 +125,105 @@ def extract_actual_date_from_cafe_page(cafe_url):
     try:
         print(f"    실제 날짜 추출 시도: {cafe_url}")
         
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        # 본문 전체를 받지 않고 앞부분만 스트리밍으로 읽은 뒤 연결 종료
+        response = _session.get(cafe_url, timeout=5, stream=True)
+        try:
+            status_code = response.status_code
+            content = read_text_prefix(response, 10000) if status_code == 200 else ''  # 처음 10KB만 분석
+        finally:
+            response.close()
         
-        response = requests.get(cafe_url, headers=headers, timeout=5)
-        if response.status_code == 200:
-            content = response.text[:10000]  # 처음 10KB만 분석
+        if status_code == 200:
             
-            # 네이버 카페 날짜 패턴들
-            date_patterns = [
-                # JSON 데이터에서 날짜 추출
-                r'"writeDate":"([^"]+)"',
-                r'"regDate":"([^"]+)"', 
-                r'"date":"(\d{4}\.\d{1,2}\.\d{1,2})"',
-                r'"created":"(\d{4}-\d{1,2}-\d{1,2})"',
-                # HTML에서 날짜 패턴
-                r'작성일[:\s]*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',
-                r'등록일[:\s]*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',
-                r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\s*\d{1,2}:\d{1,2}',
-                # 다양한 형식의 날짜
-                r'(\d{4})-(\d{1,2})-(\d{1,2})',
-                r'(\d{2})\.(\d{1,2})\.(\d{1,2})',
-                # 메타 데이터에서
-                r'<meta[^>]*content="([^"]*\d{4}-\d{1,2}-\d{1,2}[^"]*)"',
-                # 시간 정보 포함
-                r'(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일',
-            ]
-            
-            for pattern in date_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    for match in matches:
-                        try:
-                            if isinstance(match, tuple) and len(match) >= 3:
-                                # 튜플 형태 (년, 월, 일)
-                                year = int(match[0])
-                                month = int(match[1]) 
-                                day = int(match[2])
+            # 우선순위 순서대로 패턴을 검사하되, 매치를 모두 모으지 않고 첫 유효 날짜에서 중단
+            for pattern in _CAFE_PAGE_DATE_PATTERNS:
+                for m in pattern.finditer(content):
+                    # findall과 같은 형태 (그룹 1개는 문자열, 여러 개는 튜플)
+                    match = m.group(1) if pattern.groups == 1 else m.groups()
+                    try:
+                        if isinstance(match, tuple) and len(match) >= 3:
+                            # 튜플 형태 (년, 월, 일)
+                            year = int(match[0])
+                            month = int(match[1]) 
+                            day = int(match[2])
+                            
+                            # 2자리 연도 처리
+                            if year < 100:
+                                year = 2000 + year if year < 50 else 1900 + year
                                 
-                                # 2자리 연도 처리
-                                if year < 100:
-                                    year = 2000 + year if year < 50 else 1900 + year
-                                    
-                            elif isinstance(match, str):
-                                # 문자열 형태에서 날짜 추출
-                                if '-' in match:
-                                    parts = match.split('-')
-                                    if len(parts) >= 3:
-                                        year = int(parts[0])
-                                        month = int(parts[1])
-                                        day = int(parts[2])
-                                elif '.' in match:
-                                    parts = match.split('.')
-                                    if len(parts) >= 3:
-                                        year = int(parts[0])
-                                        month = int(parts[1])
-                                        day = int(parts[2])
-                                else:
-                                    continue
+                        elif isinstance(match, str):
+                            # 문자열 형태에서 날짜 추출
+                            if '-' in match:
+                                parts = match.split('-')
+                                if len(parts) >= 3:
+                                    year = int(parts[0])
+                                    month = int(parts[1])
+                                    day = int(parts[2])
+                            elif '.' in match:
+                                parts = match.split('.')
+                                if len(parts) >= 3:
+                                    year = int(parts[0])
+                                    month = int(parts[1])
+                                    day = int(parts[2])
                             else:
                                 continue
-                            
-                            # 유효성 검사
-                            if 2020 <= year <= 2025 and 1 <= month <= 12 and 1 <= day <= 31:
-                                extracted_date = date(year, month, day)
-                                print(f"    ✓ 실제 날짜 추출 성공: {extracted_date}")
-                                return extracted_date
-                                
-                        except (ValueError, IndexError) as e:
+                        else:
                             continue
+                        
+                        # 유효성 검사
+                        if 2020 <= year <= 2025 and 1 <= month <= 12 and 1 <= day <= 31:
+                            extracted_date = date(year, month, day)
+                            print(f"    ✓ 실제 날짜 추출 성공: {extracted_date}")
+                            return extracted_date
+                            
+                    except (ValueError, IndexError) as e:
+                        continue
             
             print(f"    ✗ 날짜 패턴을 찾을 수 없음")
         else:
-            print(f"    ✗ 페이지 접근 실패: {response.status_code}")
+            print(f"    ✗ 페이지 접근 실패: {status_code}")
             
         return None
     except Exception as e:
         print(f"    ✗ 실제 날짜 추출 오류: {e}")
         return None
 
+# 최근 게시물 추정 키워드
+_RECENT_INDICATORS = ('2025', '최근', '지금', '요즘', '현재', '오늘', '어제', '이번달', '이번주')
+
+# 맥락 기반 추정 시 오늘 기준 차감 기간
+_ONE_DAY = timedelta(days=1)
+_THREE_DAYS = timedelta(days=3)
+_ONE_WEEK = timedelta(days=7)
+
 def estimate_date_from_cafe_context(cafe_info, search_keyword):
     """
     카페 정보와 검색 키워드 맥락에서 날짜 추정
     """
+    today = date.today()
+    
     try:
         title = cafe_info.get('title', '')
         description = cafe_info.get('description', '')
         
         # 최근 키워드 패턴 검색
-        recent_indicators = ['2025', '최근', '지금', '요즘', '현재', '오늘', '어제', '이번달', '이번주']
         text = f"{title} {description}".lower()
         
-        if any(indicator in text for indicator in recent_indicators):
+        if any(indicator in text for indicator in _RECENT_INDICATORS):
             # 최근 게시물로 추정
-            return datetime.now().date() - timedelta(days=1)  # 어제 날짜
+            return today - _ONE_DAY  # 어제 날짜
         
         # 검색 키워드 관련성 체크
         if search_keyword.lower() in text:
             # 관련성 높은 게시물은 비교적 최근으로 추정
-            return datetime.now().date() - timedelta(days=3)
+            return today - _THREE_DAYS
         
         # 기본 추정 (일주일 전)
-        return datetime.now().date() - timedelta(days=7)
+        return today - _ONE_WEEK
         
     except Exception as e:
         print(f"    맥락 분석 오류: {e}")
-        return datetime.now().date() - timedelta(days=7)
+        return today - _ONE_WEEK
 
 def extract_cafe_date_advanced(cafe_info, search_keyword=""):
     """
@@ -207,6 +253,23 @@ def extract_cafe_date_advanced(cafe_info, search_keyword=""):
     print(f"    맥락 기반 추정: {context_date}")
     return context_date
 
+# 뉴스기사 판별 키워드
+_NEWS_INDICATORS = (
+    "뉴스", "기사", "보도", "보도자료", "press", "뉴스기사", "언론", "미디어", 
+    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
+    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드"
+)
+_NEWS_INDICATOR_RE = re.compile('|'.join(map(re.escape, _NEWS_INDICATORS)))
+
+# SOHO우리가게패키지 필터 키워드 ('우리가게' / 'LG'·'유플러스'·'U+' 표기)
+_SOHO_STORE_KEYWORDS = ('우리가게', '우리 가게')
+_SOHO_CARRIER_KEYWORDS = (
+    'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
+    '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
+)
+_SOHO_STORE_RE = re.compile('|'.join(map(re.escape, _SOHO_STORE_KEYWORDS)))
+_SOHO_CARRIER_RE = re.compile('|'.join(map(re.escape, _SOHO_CARRIER_KEYWORDS)))
+
 def filter_cafe_by_advanced_date(cafe_results, start_date, end_date, search_keyword="", max_results=50):
     """
     간단한 날짜 추출을 통한 네이버 카페 필터링
@@ -222,49 +285,25 @@ def filter_cafe_by_advanced_date(cafe_results, start_date, end_date, search_keyw
         
         try:
             # 새로운 간단한 날짜 추출 시스템 사용
-            from naver_cafe_real_date_simple import get_cafe_date_with_fallback
             extracted_date = get_cafe_date_with_fallback(cafe)
             
             if extracted_date and start_date <= extracted_date <= end_date:
-                # 뉴스기사 필터링
+                # HTML 태그 제거 및 엔티티 디코딩 (naver_api와 같은 정리 함수 사용)
                 title = cafe.get("title", "")
                 description = cafe.get("description", "")
-                text_content = (title + " " + description).lower()
-                
-                news_indicators = [
-                    "뉴스", "기사", "보도", "보도자료", "press", "뉴스기사", "언론", "미디어", 
-                    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
-                    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드"
-                ]
+                clean_title = strip_html(title)
+                clean_description = strip_html(description)
+                text_content = (clean_title + " " + clean_description).lower()
                 
-                if any(indicator in text_content for indicator in news_indicators):
+                # 뉴스기사 필터링
+                if _NEWS_INDICATOR_RE.search(text_content):
                     print(f"    뉴스 기사 제외: {title[:30]}...")
                     continue
                 
-                # HTML 태그 제거 및 엔티티 디코딩
-                import re
-                clean_title = re.sub(r'<[^>]+>', '', title)
-                clean_description = re.sub(r'<[^>]+>', '', description)
-                
-                clean_title = clean_title.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                clean_title = clean_title.replace('&quot;', '"').replace('&#39;', "'")
-                clean_description = clean_description.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                clean_description = clean_description.replace('&quot;', '"').replace('&#39;', "'")
-                
                 # SOHO우리가게패키지 특별 필터링: '우리가게'와 함께 'LG' 또는 '유플러스' 또는 'U+' 언급된 글만
                 if search_keyword == "SOHO우리가게패키지":
-                    full_content = (clean_title + " " + clean_description).lower()
-                    
-                    # '우리가게' 키워드 체크
-                    has_우리가게 = any(keyword in full_content for keyword in ['우리가게', '우리 가게'])
-                    
-                    # 'LG' 또는 '유플러스' 또는 'U+' 키워드 체크
-                    has_lg_or_uplus = any(keyword in full_content for keyword in [
-                        'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                        '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
-                    ])
-                    
-                    if not (has_우리가게 and has_lg_or_uplus):
+                    # '우리가게' 키워드와 'LG' 또는 '유플러스' 또는 'U+' 키워드 체크
+                    if not (_SOHO_STORE_RE.search(text_content) and _SOHO_CARRIER_RE.search(text_content)):
                         print(f"    ❌ 카페 제외 (키워드 불일치): {clean_title[:30]}...")
                         continue
                     
@@ -290,9 +329,6 @@ def filter_cafe_by_advanced_date(cafe_results, start_date, end_date, search_keyw
                 
             elif extracted_date:
                 print(f"    날짜 범위 밖: {extracted_date} (범위: {start_date} ~ {end_date})")
-            
-            # 요청 간 딜레이
-            time.sleep(0.2)
                 
         except Exception as e:
             print(f"    카페 처리 오류: {e}")
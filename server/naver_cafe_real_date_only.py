@@ -7,6 +7,40 @@ import re
 import requests
 from datetime import datetime, date, timedelta
 from urllib.parse import urlparse, parse_qs
+from html import unescape
+
+# 네이버 검색 결과의 HTML 태그
+_TAG_RE = re.compile(r'<[^>]+>')
+
+# 뉴스기사 제외 키워드
+_NEWS_INDICATORS = (
+    "뉴스", "기사", "보도", "보도자료", "press", "뉴스기사", "언론", "미디어",
+    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
+    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드"
+)
+
+# SOHO: '우리가게' 키워드
+_URIGAGE_KEYWORDS = ('우리가게', '우리 가게')
+
+# SOHO: 'LG' 또는 '유플러스' 또는 'U+' 키워드
+_SOHO_TELECOM_KEYWORDS = (
+    'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
+    '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
+)
+
+# 익시오: 통신사 키워드
+_IXIO_TELECOM_KEYWORDS = (
+    'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
+    'u+', 'u +', 'u플러스', 'uplus', 'u plus',
+    '유플러스', '유 플러스', '유플', '유+', '유 +'
+)
+
+# 서비스별 serviceId 매핑
+_SERVICE_ID_MAP = {
+    "익시오": "ixio",
+    "SOHO우리가게패키지": "soho-package",
+    "AI비즈콜": "ai-bizcall"
+}
 
 def extract_real_date_only(cafe_info):
     """
@@ -457,13 +491,7 @@ def filter_cafe_by_real_date_only(cafe_results, start_date, end_date, service_na
                 description = cafe.get("description", "")
                 text_content = (title + " " + description).lower()
                 
-                news_indicators = [
-                    "뉴스", "기사", "보도", "보도자료", "press", "뉴스기사", "언론", "미디어", 
-                    "기자", "취재", "신문", "방송", "뉴스룸", "보도국", "편집부", "news",
-                    "관련 기사", "속보", "단독", "특보", "일보", "타임즈", "헤럴드"
-                ]
-                
-                if any(indicator in text_content for indicator in news_indicators):
+                if any(indicator in text_content for indicator in _NEWS_INDICATORS):
                     print(f"    ❌ 뉴스 기사로 제외: {title[:30]}...")
                     continue
                 
@@ -473,13 +501,10 @@ def filter_cafe_by_real_date_only(cafe_results, start_date, end_date, service_na
                     full_content = text_content
                     
                     # '우리가게' 키워드 체크
-                    has_우리가게 = any(keyword in full_content for keyword in ['우리가게', '우리 가게'])
+                    has_우리가게 = any(keyword in full_content for keyword in _URIGAGE_KEYWORDS)
                     
                     # 'LG' 또는 '유플러스' 또는 'U+' 키워드 체크
-                    has_lg_or_uplus = any(keyword in full_content for keyword in [
-                        'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                        '유플러스', '유 플러스', '유플', 'uplus', 'u plus', 'u+', 'u +'
-                    ])
+                    has_lg_or_uplus = any(keyword in full_content for keyword in _SOHO_TELECOM_KEYWORDS)
                     
                     if not (has_우리가게 and has_lg_or_uplus):
                         print(f"    ❌ SOHO 키워드 불일치로 제외: {title[:30]}...")
@@ -492,11 +517,7 @@ def filter_cafe_by_real_date_only(cafe_results, start_date, end_date, service_na
                     full_content = text_content
                     
                     # 통신사 키워드 체크
-                    has_telecom_keywords = any(keyword in full_content for keyword in [
-                        'lg', 'l g', 'lgu', 'lg u+', 'lg유플러스',
-                        'u+', 'u +', 'u플러스', 'uplus', 'u plus',
-                        '유플러스', '유 플러스', '유플', '유+', '유 +'
-                    ])
+                    has_telecom_keywords = any(keyword in full_content for keyword in _IXIO_TELECOM_KEYWORDS)
                     
                     if not has_telecom_keywords:
                         print(f"    ❌ 익시오 통신사 키워드 없음으로 제외: {title[:30]}...")
@@ -505,25 +526,14 @@ def filter_cafe_by_real_date_only(cafe_results, start_date, end_date, service_na
                     print(f"    ✅ 익시오 통신사 키워드 발견: {title[:30]}...")
                 
                 # HTML 태그 제거 및 엔티티 디코딩
-                import re
-                clean_title = re.sub(r'<[^>]+>', '', title)
-                clean_description = re.sub(r'<[^>]+>', '', description)
-                
-                clean_title = clean_title.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                clean_title = clean_title.replace('&quot;', '"').replace('&#39;', "'")
-                clean_description = clean_description.replace('&lt;', '<').replace('&gt;', '>').replace('&amp;', '&')
-                clean_description = clean_description.replace('&quot;', '"').replace('&#39;', "'")
+                clean_title = unescape(_TAG_RE.sub('', title))
+                clean_description = unescape(_TAG_RE.sub('', description))
                 
                 # 사용자 ID 추출
                 user_id = cafe.get("extracted_user_id") or f"카페_{cafe.get('cafename', 'unknown')}"
                 
                 # 서비스별 serviceId 매핑
-                service_id_map = {
-                    "익시오": "ixio",
-                    "SOHO우리가게패키지": "soho-package", 
-                    "AI비즈콜": "ai-bizcall"
-                }
-                service_id = service_id_map.get(service_name, "ixio")
+                service_id = _SERVICE_ID_MAP.get(service_name, "ixio")
                 
                 cafe_review = {
                     "userId": user_id,
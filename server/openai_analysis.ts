@@ -325,6 +325,17 @@ export async function generateClusterLabel(keywords: string[]): Promise<string>
   }
 }
 
+export async function generateClusterLabels(clusters: { id: number | string; keywords: string[] }[]): Promise<Record<string, string>> {
+  // Label every cluster concurrently so the caller needs a single round trip
+  const labels = await Promise.all(clusters.map(cluster => generateClusterLabel(cluster.keywords)));
+
+  const result: Record<string, string> = {};
+  clusters.forEach((cluster, index) => {
+    result[String(cluster.id)] = labels[index];
+  });
+  return result;
+}
+
 export async function generateKeywordNetworkWithGPT(reviews: any[]): Promise<any> {
   if (!reviews || reviews.length === 0) {
     return { positive: [], negative: [], neutral: [], nodes: [], links: [] };
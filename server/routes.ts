@@ -6,7 +6,7 @@ import { spawn } from "child_process";
 import path from "path";
 import fs from "fs";
 import { fileURLToPath } from "url";
-import { analyzeReviewSentimentWithGPT, analyzeReviewSentimentBatch, analyzeHeartFrameworkWithGPT, generateClusterLabel } from "./openai_analysis";
+import { analyzeReviewSentimentWithGPT, analyzeReviewSentimentBatch, analyzeHeartFrameworkWithGPT, generateClusterLabel, generateClusterLabels } from "./openai_analysis";
 import { insertReviewSchema } from "../shared/schema";
 
 const __filename = fileURLToPath(import.meta.url);
@@ -869,6 +869,21 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
 
+  app.post("/api/generate-cluster-labels", async (req, res) => {
+    try {
+      const { clusters } = req.body;
+      if (!clusters || !Array.isArray(clusters) || !clusters.every((c: any) => c && Array.isArray(c.keywords))) {
+        return res.status(400).json({ error: "clusters array with keywords is required" });
+      }
+
+      const labels = await generateClusterLabels(clusters);
+      res.json({ labels });
+    } catch (error) {
+      console.error('Cluster labels generation error:', error);
+      res.status(500).json({ error: "Failed to generate cluster labels" });
+    }
+  });
+
   // Get keyword network data (legacy endpoint)
   app.get("/api/keyword-network/:serviceId", async (req, res) => {
     try {
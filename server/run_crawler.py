@@ -8,9 +8,29 @@ Crawler runner script for Node.js integration
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from crawler import crawl_service_by_selection
 
+def post_review(session, review_data):
+    """
+    Send a single review to the Node.js API
+    
+    Args:
+        session: Shared requests.Session
+        review_data: Review payload
+        
+    Returns:
+        requests.Response
+    """
+    return session.post(
+        'http://localhost:5000/api/reviews/create',
+        json=review_data,
+        headers={'Content-Type': 'application/json'}
+    )
+
 def main():
     try:
         # Parse command line arguments
@@ -59,8 +79,15 @@ def main():
             review_count=review_count
         )
         
-        # Process and send reviews to Node.js API
-        total_reviews = 0
+        # Reuse one pooled connection to the Node.js API for all review POSTs
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3))
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        
+        # Prepare review payloads for the Node.js API
+        payloads = []
         for source, reviews in results.items():
             if isinstance(reviews, list):
                 print(f"Processing {len(reviews)} reviews from {source}")
@@ -93,7 +120,7 @@ def main():
                                 'source': mapped_source,  # 소스 매핑 수정
                                 'createdAt': created_at,
                                 'serviceId': service_id,
-                                'appId': review.get('appId', str(total_reviews)),
+                                'appId': review.get('appId', str(len(payloads))),
                                 'link': review.get('link', '')
                             }
                         else:
@@ -110,26 +137,33 @@ def main():
                                 'source': mapped_source,
                                 'createdAt': created_at,
                                 'serviceId': service_id,
-                                'appId': review.get('appId', str(total_reviews))
+                                'appId': review.get('appId', str(len(payloads)))
                             }
                         
-                        # Send to Node.js API
-                        response = requests.post(
-                            'http://localhost:5000/api/reviews/create',
-                            json=review_data,
-                            headers={'Content-Type': 'application/json'}
-                        )
-                        
-                        if response.status_code == 200:
-                            print(f"Created review {total_reviews + 1}: {review_data['userId'][:20]} - {review_data['content'][:50]}...")
-                            total_reviews += 1
-                        else:
-                            print(f"Failed to create review: {response.status_code}")
+                        payloads.append(review_data)
                             
                     except Exception as e:
                         print(f"Error processing review: {e}")
                         continue
         
+        # Send reviews to Node.js API concurrently over the pooled session
+        total_reviews = 0
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {executor.submit(post_review, session, review_data): review_data for review_data in payloads}
+            for future in as_completed(futures):
+                review_data = futures[future]
+                try:
+                    response = future.result()
+                    
+                    if response.status_code == 200:
+                        print(f"Created review {total_reviews + 1}: {review_data['userId'][:20]} - {review_data['content'][:50]}...")
+                        total_reviews += 1
+                    else:
+                        print(f"Failed to create review: {response.status_code}")
+                        
+                except Exception as e:
+                    print(f"Error processing review: {e}")
+        
         print(f"Successfully processed {total_reviews} reviews")
         
         # Perform batch sentiment analysis if reviews were collected
@@ -137,14 +171,14 @@ def main():
             print("Starting batch sentiment analysis...")
             
             # Get all reviews for sentiment analysis
-            reviews_response = requests.get('http://localhost:5000/api/reviews?limit=1000')
+            reviews_response = session.get('http://localhost:5000/api/reviews?limit=1000')
             if reviews_response.status_code == 200:
                 reviews_data = reviews_response.json()
                 review_texts = [review['content'] for review in reviews_data.get('reviews', [])]
                 
                 if review_texts:
                     # Perform batch sentiment analysis
-                    sentiment_response = requests.post(
+                    sentiment_response = session.post(
                         'http://localhost:5000/api/gpt-sentiment-batch',
                         json={'texts': review_texts},
                         headers={'Content-Type': 'application/json'}
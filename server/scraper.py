@@ -12,6 +12,9 @@ import pandas as pd
 import xml.etree.ElementTree as ET
 import random
 import re
+import heapq
+from collections import Counter
+from operator import itemgetter
 from service_data import get_service_keywords, get_service_info
 from naver_api import search_naver, extract_text_from_html
 import os
@@ -97,6 +100,52 @@ def generate_random_date_in_range(start_dt, end_dt):
     # Convert back to datetime
     return datetime.fromtimestamp(random_timestamp, tz=timezone.utc)
 
+def _build_keyword_scorer(*groups):
+    """
+    Build a scorer that checks every keyword group against a text in one regex pass
+    
+    Args:
+        groups: Keyword lists, one per score bucket (a keyword listed twice counts twice)
+        
+    Returns:
+        Function mapping a text to a list of per-group counts, equal to
+        sum(1 for keyword in group if keyword in text) for each group
+    """
+    keywords = sorted({keyword for group in groups for keyword in group}, key=len, reverse=True)
+    # Longest alternative first, so each match reports the longest keyword at its start
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    # A matched keyword implies every keyword it contains, ex) '최고급' -> '최고'
+    contained = {keyword: [other for other in keywords if other in keyword] for keyword in keywords}
+    weights = {keyword: [group.count(keyword) for group in groups] for keyword in keywords}
+    
+    def score(text):
+        found = set()
+        search = pattern.search
+        match = search(text)
+        while match is not None:
+            found.update(contained[match.group()])
+            # Resume one character later so overlapping keywords are not skipped
+            match = search(text, match.start() + 1)
+        
+        counts = [0] * len(groups)
+        for keyword in found:
+            for idx, weight in enumerate(weights[keyword]):
+                counts[idx] += weight
+        return counts
+    
+    return score
+
+# Keyword tables for analyze_text_sentiment_fast
+_FAST_PRIORITY_NEGATIVE_RE = re.compile('|'.join(map(re.escape, [
+    '안되', '안돼', '안되어', '안되네', '안되요', '안됨', '거절', '못하는', '안하는', '안돼는', '조치'
+])))
+_FAST_SCORER = _build_keyword_scorer(
+    # Strong negative indicators
+    ['최악', '형편없', '별로', '짜증', '실망', '불편', '문제', '오류', '버그', '끊김', '귀찮', '스트레스', '힘들', '어렵', '복잡'],
+    # Strong positive indicators
+    ['최고', '좋아', '만족', '편리', '감사', '추천', '대박', '완벽', '훌륭']
+)
+
 def analyze_text_sentiment_fast(text):
     """
     Fast rule-based sentiment analysis for obvious cases
@@ -110,17 +159,10 @@ def analyze_text_sentiment_fast(text):
     content = text.lower()
     
     # Priority negative patterns
-    priority_negative = ['안되', '안돼', '안되어', '안되네', '안되요', '안됨', '거절', '못하는', '안하는', '안돼는', '조치']
-    if any(pattern in content for pattern in priority_negative):
+    if _FAST_PRIORITY_NEGATIVE_RE.search(content):
         return '부정'
     
-    # Strong negative indicators
-    strong_negative = ['최악', '형편없', '별로', '짜증', '실망', '불편', '문제', '오류', '버그', '끊김', '귀찮', '스트레스', '힘들', '어렵', '복잡']
-    # Strong positive indicators  
-    strong_positive = ['최고', '좋아', '만족', '편리', '감사', '추천', '대박', '완벽', '훌륭']
-    
-    neg_count = sum(1 for word in strong_negative if word in content)
-    pos_count = sum(1 for word in strong_positive if word in content)
+    neg_count, pos_count = _FAST_SCORER(content)
     
     if neg_count > 0 and pos_count == 0:
         return '부정'
@@ -225,61 +267,55 @@ def analyze_sentiment_with_gpt(text):
         print(f"GPT sentiment analysis error: {e}", file=sys.stderr)
         return analyze_text_sentiment_fallback(text)
 
-def analyze_text_sentiment_fallback(text):
-    """
-    Enhanced rule-based sentiment analysis with comprehensive Korean patterns
-    """
-    if not text or not isinstance(text, str):
-        return "중립"
-    
-    content = text.lower()
-    
-    # Priority negative patterns - these override everything else
-    priority_negative_patterns = [
-        '안되', '안돼', '안되어', '안되네', '안되요', '안됨', '안되고', '안되니', '안되는',
-        '안되서', '안되면', '안되겠', '안되잖', '안되다', '안되나', '안되든', '안되었',
-        '안되지', '안되더', '안되는구나', '안되는데', '안되길래', '안되던데'
-    ]
-    
-    # Check for priority negative patterns first
-    has_priority_negative = any(pattern in content for pattern in priority_negative_patterns)
-    if has_priority_negative:
-        return "부정"
-    
+# Keyword tables for analyze_text_sentiment_fallback
+_FALLBACK_PRIORITY_NEGATIVE_RE = re.compile('|'.join(map(re.escape, [
+    '안되', '안돼', '안되어', '안되네', '안되요', '안됨', '안되고', '안되니', '안되는',
+    '안되서', '안되면', '안되겠', '안되잖', '안되다', '안되나', '안되든', '안되었',
+    '안되지', '안되더', '안되는구나', '안되는데', '안되길래', '안되던데',
     # Priority rule: Any review containing '불편' is automatically negative
-    if '불편' in content:
-        return "부정"
-    
+    '불편'
+])))
+_FALLBACK_SCORER = _build_keyword_scorer(
     # Strong negative keywords (high confidence)
-    strong_negative_keywords = [
+    [
         '최악', '형편없', '별로', '짜증', '화남', '실망', '못하겠', '삭제',
         '에러', '오류', '버그', '문제', '고장', '먹통', '렉', '끊김', '느려', '답답',
         '구려', '나쁨', '싫어', '불만', '아쉬운', '단점', '불편', '거슬림', '과열'
-    ]
-    
+    ],
     # Strong positive keywords (high confidence)
-    strong_positive_keywords = [
+    [
         '최고', '대박', '완벽', '훌륭', '멋져', '좋아', '좋네', '좋음', '편리', '편해',
         '만족', '추천', '감사', '고마워', '유용', '도움', '빠름', '빨라', '쉬워', '간단',
         '훌륭', '예쁘', '이쁘', '굿', '베스트', '최고급', '뛰어난', '인상적'
-    ]
-    
-    # Moderate keywords (medium confidence)
-    moderate_negative_keywords = [
+    ],
+    # Moderate negative keywords (medium confidence)
+    [
         '못하', '안해', '실패', '느림', '복잡', '어렵', '힘들', '귀찮', '스트레스',
         '렉', '튕김', '멈춤', '종료', '재시작', '작동안함', '실행안됨'
-    ]
-    
-    moderate_positive_keywords = [
+    ],
+    # Moderate positive keywords (medium confidence)
+    [
         '괜찮', '나쁘지않', '적당', '쓸만', '보통이상', '해볼만', '괜찮네', '나름',
         '쓸만해', '적당해', '보통', '평범', '무난'
     ]
+)
+
+def analyze_text_sentiment_fallback(text):
+    """
+    Enhanced rule-based sentiment analysis with comprehensive Korean patterns
+    """
+    if not text or not isinstance(text, str):
+        return "중립"
+    
+    content = text.lower()
+    
+    # Priority negative patterns - these override everything else
+    if _FALLBACK_PRIORITY_NEGATIVE_RE.search(content):
+        return "부정"
     
     # Count occurrences
-    strong_negative_count = sum(1 for keyword in strong_negative_keywords if keyword in content)
-    strong_positive_count = sum(1 for keyword in strong_positive_keywords if keyword in content)
-    moderate_negative_count = sum(1 for keyword in moderate_negative_keywords if keyword in content)
-    moderate_positive_count = sum(1 for keyword in moderate_positive_keywords if keyword in content)
+    (strong_negative_count, strong_positive_count,
+     moderate_negative_count, moderate_positive_count) = _FALLBACK_SCORER(content)
     
     # Calculate weighted scores
     negative_score = strong_negative_count * 3 + moderate_negative_count * 1
@@ -350,33 +386,37 @@ def extract_korean_words_advanced(text_list, sentiment='positive', max_words=10)
         print(f"Error in advanced Korean processing: {e}, falling back to basic processing", file=sys.stderr)
         return extract_korean_words_basic(text_list, sentiment, max_words)
 
+# Korean words of two or more syllables, for extract_korean_words_basic
+_KOREAN_WORD_RE = re.compile(r'[가-힣]{2,}')
+
+# Common words and particles skipped by extract_korean_words_basic
+_BASIC_SKIP_WORDS = frozenset([
+    '이것', '그것', '저것', '여기', '거기', '저기', '이렇게', '그렇게', '저렇게', '때문', '위해', '통해', '대해',
+    '에서', '으로', '에게', '한테', '에도', '도', '는', '은', '이', '가', '을', '를', '의', '과', '와', '에',
+    '로', '만', '부터', '까지', '보다', '처럼', '같이', '마다', '마저', '조차', '밖에', '외에', '대신', '말고'
+])
+
 def extract_korean_words_basic(text_list, sentiment='positive', max_words=10):
     """
     Basic Korean word extraction using regex and frequency analysis
     """
-    word_freq = {}
+    word_freq = Counter()
     
     for text in text_list:
         if not text or not isinstance(text, str):
             continue
-            
-        # Remove punctuation and split into words
-        import re
-        korean_words = re.findall(r'[가-힣]+', text)
-        
-        for word in korean_words:
-            if len(word) >= 2:  # Filter out single characters
-                # Skip common words and particles
-                skip_words = ['이것', '그것', '저것', '여기', '거기', '저기', '이렇게', '그렇게', '저렇게', '때문', '위해', '통해', '대해', '에서', '으로', '에게', '한테', '에도', '도', '는', '은', '이', '가', '을', '를', '의', '과', '와', '에', '에서', '으로', '로', '만', '부터', '까지', '보다', '처럼', '같이', '마다', '마저', '조차', '밖에', '외에', '대신', '말고']
-                
-                if word not in skip_words:
-                    word_freq[word] = word_freq.get(word, 0) + 1
+        
+        # Count Korean words as the regex finds them, skipping common words and particles
+        for match in _KOREAN_WORD_RE.finditer(text):
+            word = match.group()
+            if word not in _BASIC_SKIP_WORDS:
+                word_freq[word] += 1
     
-    # Sort by frequency and return top words
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+    # Top words by frequency (ties keep first-seen order)
+    top_words = heapq.nlargest(max_words, word_freq.items(), key=itemgetter(1))
     
     result = []
-    for word, freq in sorted_words[:max_words]:
+    for word, freq in top_words:
         result.append({
             'word': word,
             'frequency': freq,
@@ -640,6 +680,31 @@ def analyze_text_sentiment(text):
         print(f"Rule-based analysis failed: {e}, defaulting to neutral", file=sys.stderr)
         return "중립"
 
+def _analyze_text_sentiment_quiet(text):
+    """
+    analyze_text_sentiment without the per-text log line, for batch use
+    """
+    try:
+        return analyze_text_sentiment_fallback(text)
+    except Exception as e:
+        print(f"Rule-based analysis failed: {e}, defaulting to neutral", file=sys.stderr)
+        return "중립"
+
+def analyze_text_sentiment_batch(texts):
+    """
+    Rule-based three-way sentiment analysis for a whole batch of reviews
+    
+    Args:
+        texts: List of review text content
+        
+    Returns:
+        List: '긍정', '부정', or '중립' for each text, in input order
+    """
+    # Keep the per-text neutral fallback so one bad text cannot abort the batch
+    results = [_analyze_text_sentiment_quiet(text) for text in texts]
+    print(f"Rule-based sentiment: {len(results)} reviews analyzed", file=sys.stderr)
+    return results
+
 def analyze_text_sentiment_original(text):
     """
     Original enhanced three-way Korean sentiment analysis (positive, negative, neutral)
@@ -1327,6 +1392,42 @@ POS/결제: 네이버페이 사장용, 카카오페이 사장용, 토스페이
 스팸차단: 더콜러(Truecaller), 위즈콜(WhoCall), 콜 블로커(Call Blocker)
 안정성: 통신사 기본 전화 앱들, 삼성전화, LG전화"""
 
+# Keyword tables for the analyze_sentiments HEART issue tracking
+# Task Success - core functionality problems
+_HEART_TASK_SUCCESS_RE = re.compile('|'.join(map(re.escape, [
+    '오류', '에러', '버그', '튕', '꺼짐', '작동안함', '실행안됨', '끊김', '연결안됨', '안들림',
+    '소리안남', '안됨', '안되', '크래시', '종료', '재시작', '문제', '불편', '안받아지', '받아지지',
+    '실행되지', '작동하지', '끊어지', '끊긴다', '당황스러운', '기다려야', '슬라이드', '백그라운드',
+    '자동으로', '넘어가지', '계속', '볼륨버튼', '진동', '꺼지면', '좋겠네요', '차량', '블투',
+    '통화종료', '음악재생', '스팸정보', '딸려와서', '번호확인'
+])))
+_HEART_CRASH_RE = re.compile('튕|꺼짐|크래시')
+_HEART_HARDWARE_RE = re.compile('볼륨버튼|진동')
+_HEART_BACKGROUND_RE = re.compile('백그라운드|자동으로')
+_HEART_UI_RE = re.compile('스팸정보|슬라이드')
+_HEART_CALL_RE = re.compile('통화|전화')
+# Happiness - user satisfaction issues
+_HEART_HAPPINESS_RE = re.compile('|'.join(map(re.escape, [
+    '짜증', '최악', '실망', '화남', '불만', '별로', '구림', '싫어', '답답', '스트레스',
+    '당황스러운', '불편', '기다려야', '문제'
+])))
+_HEART_STRONG_UNHAPPY_RE = re.compile('최악|화남')
+_HEART_UX_DEGRADE_RE = re.compile('당황스러운|불편')
+# Engagement - usage patterns
+_HEART_ENGAGEMENT_RE = re.compile('|'.join(map(re.escape, [
+    '안써', '사용안함', '재미없', '지루', '흥미없', '별로안쓴', '가끔만', '좋지만', '하지만',
+    '그런데', '다만', '아쉬운', '더', '추가', '개선', '향상', '좋겠네요'
+])))
+_HEART_SUGGESTION_RE = re.compile('좋지만|하지만|좋겠네요')
+# Retention - churn indicators
+_HEART_RETENTION_RE = re.compile('|'.join(map(re.escape, [
+    '삭제', '해지', '그만', '안쓸', '다른거', '바꿀', '탈퇴', '포기', '중단'
+])))
+# Adoption - onboarding difficulties
+_HEART_ADOPTION_RE = re.compile('|'.join(map(re.escape, [
+    '어려움', '복잡', '모르겠', '헷갈', '어떻게', '설명부족', '사용법', '가이드', '도움말'
+])))
+
 def analyze_sentiments(reviews):
     """
     Enhanced HEART framework analysis with dynamic insights generation
@@ -1352,14 +1453,17 @@ def analyze_sentiments(reviews):
     print(benchmark_info, file=sys.stderr)
     
     # Re-analyze sentiment based on text content only (ignore star ratings)
-    for review in reviews:
-        # Update sentiment based on text analysis
-        review['sentiment'] = analyze_text_sentiment(review['content'])
+    sentiments = analyze_text_sentiment_batch([review['content'] for review in reviews])
+    # Bucket texts by sentiment in the same pass; the word cloud below reuses them
+    texts_by_sentiment = {'긍정': [], '부정': [], '중립': []}
+    for review, sentiment in zip(reviews, sentiments):
+        review['sentiment'] = sentiment
+        texts_by_sentiment[sentiment].append(review['content'])
     
     # Debug: Print text-based sentiment analysis results
-    text_based_negative = sum(1 for r in reviews if r['sentiment'] == '부정')
-    text_based_positive = sum(1 for r in reviews if r['sentiment'] == '긍정')
-    text_based_neutral = sum(1 for r in reviews if r['sentiment'] == '중립')
+    text_based_negative = len(texts_by_sentiment['부정'])
+    text_based_positive = len(texts_by_sentiment['긍정'])
+    text_based_neutral = len(texts_by_sentiment['중립'])
     print(f"GPT-based sentiment analysis: {text_based_positive} 긍정, {text_based_negative} 부정, {text_based_neutral} 중립", file=sys.stderr)
     
     # HEART framework analysis with detailed issue tracking
@@ -1381,50 +1485,50 @@ def analyze_sentiments(reviews):
         # Even high-rated reviews can contain specific complaints and improvement suggestions
         
         # Task Success - Core functionality problems (check regardless of rating)
-        if any(keyword in content for keyword in ['오류', '에러', '버그', '튕', '꺼짐', '작동안함', '실행안됨', '끊김', '연결안됨', '안들림', '소리안남', '안됨', '안되', '크래시', '종료', '재시작', '문제', '불편', '안받아지', '받아지지', '실행되지', '작동하지', '끊어지', '끊긴다', '당황스러운', '기다려야', '슬라이드', '백그라운드', '자동으로', '넘어가지', '계속', '볼륨버튼', '진동', '꺼지면', '좋겠네요', '차량', '블투', '통화종료', '음악재생', '스팸정보', '딸려와서', '번호확인', '기다려야']):
+        if _HEART_TASK_SUCCESS_RE.search(content):
             heart_analysis['task_success']['issues'].append(content)
-            if '튕' in content or '꺼짐' in content or '크래시' in content:
+            if _HEART_CRASH_RE.search(content):
                 heart_analysis['task_success']['details'].append('앱 크래시')
             elif '연결' in content and ('안됨' in content or '끊김' in content):
                 heart_analysis['task_success']['details'].append('네트워크 연결')
             elif '소리' in content and '안남' in content:
                 heart_analysis['task_success']['details'].append('음성 기능')
-            elif '볼륨버튼' in content or '진동' in content:
+            elif _HEART_HARDWARE_RE.search(content):
                 heart_analysis['task_success']['details'].append('하드웨어 제어')
-            elif '백그라운드' in content or '자동으로' in content:
+            elif _HEART_BACKGROUND_RE.search(content):
                 heart_analysis['task_success']['details'].append('백그라운드 처리')
-            elif '스팸정보' in content or '슬라이드' in content:
+            elif _HEART_UI_RE.search(content):
                 heart_analysis['task_success']['details'].append('UI 표시 문제')
-            elif '통화' in content or '전화' in content:
+            elif _HEART_CALL_RE.search(content):
                 heart_analysis['task_success']['details'].append('통화 기능')
             else:
                 heart_analysis['task_success']['details'].append('기능 오류')
         
         # Happiness - User satisfaction issues (check regardless of rating)
-        elif any(keyword in content for keyword in ['짜증', '최악', '실망', '화남', '불만', '별로', '구림', '싫어', '답답', '스트레스', '당황스러운', '불편', '기다려야', '문제']):
+        elif _HEART_HAPPINESS_RE.search(content):
             heart_analysis['happiness']['issues'].append(content)
-            if '최악' in content or '화남' in content:
+            if _HEART_STRONG_UNHAPPY_RE.search(content):
                 heart_analysis['happiness']['details'].append('강한 불만')
-            elif '당황스러운' in content or '불편' in content:
+            elif _HEART_UX_DEGRADE_RE.search(content):
                 heart_analysis['happiness']['details'].append('사용자 경험 저하')
             else:
                 heart_analysis['happiness']['details'].append('만족도 저하')
         
         # Engagement - Usage patterns (check regardless of rating)
-        elif any(keyword in content for keyword in ['안써', '사용안함', '재미없', '지루', '흥미없', '별로안쓴', '가끔만', '좋지만', '하지만', '그런데', '다만', '아쉬운', '더', '추가', '개선', '향상', '좋겠네요']):
+        elif _HEART_ENGAGEMENT_RE.search(content):
             heart_analysis['engagement']['issues'].append(content)
-            if '좋지만' in content or '하지만' in content or '좋겠네요' in content:
+            if _HEART_SUGGESTION_RE.search(content):
                 heart_analysis['engagement']['details'].append('개선 제안')
             else:
                 heart_analysis['engagement']['details'].append('사용 빈도 저하')
         
         # Retention - Churn indicators (check regardless of rating)
-        elif any(keyword in content for keyword in ['삭제', '해지', '그만', '안쓸', '다른거', '바꿀', '탈퇴', '포기', '중단']):
+        elif _HEART_RETENTION_RE.search(content):
             heart_analysis['retention']['issues'].append(content)
             heart_analysis['retention']['details'].append('이탈 위험')
         
         # Adoption - Onboarding difficulties (check regardless of rating)
-        elif any(keyword in content for keyword in ['어려움', '복잡', '모르겠', '헷갈', '어떻게', '설명부족', '사용법', '가이드', '도움말']):
+        elif _HEART_ADOPTION_RE.search(content):
             heart_analysis['adoption']['issues'].append(content)
             heart_analysis['adoption']['details'].append('사용성 문제')
     
@@ -1649,12 +1753,9 @@ def analyze_sentiments(reviews):
     insights = insights[:5]
     
     # Enhanced Korean word frequency analysis using advanced processing
-    positive_texts = [r['content'] for r in reviews if r.get('sentiment') == '긍정']
-    negative_texts = [r['content'] for r in reviews if r.get('sentiment') == '부정']
-    
     # Use advanced Korean processing to extract meaningful words
-    positive_cloud = extract_korean_words_advanced(positive_texts, 'positive', 10)
-    negative_cloud = extract_korean_words_advanced(negative_texts, 'negative', 10)
+    positive_cloud = extract_korean_words_advanced(texts_by_sentiment['긍정'], 'positive', 10)
+    negative_cloud = extract_korean_words_advanced(texts_by_sentiment['부정'], 'negative', 10)
     
     print(f"Generated {len(insights)} HEART insights, {len(positive_cloud)} positive words, {len(negative_cloud)} negative words", file=sys.stderr)
     
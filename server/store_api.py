@@ -23,8 +23,8 @@ def crawl_google_play(app_id, count=100, lang='ko', country='kr', start_date=Non
         start_date: Start date for filtering (ISO format)
         end_date: End date for filtering (ISO format)
         
-    Returns:
-        List of review dictionaries
+    Yields:
+        Review dictionaries, one at a time, as they pass the date filter
     """
     try:
         # Fetch reviews from Google Play Store
@@ -37,7 +37,6 @@ def crawl_google_play(app_id, count=100, lang='ko', country='kr', start_date=Non
         )
         
         # Process and clean the data with date filtering
-        processed_reviews = []
         for review in result:
             review_date = review['at']
             
@@ -80,13 +79,10 @@ def crawl_google_play(app_id, count=100, lang='ko', country='kr', start_date=Non
                 'appVersion': review.get('appVersion', ''),
                 'thumbsUpCount': review.get('thumbsUpCount', 0)
             }
-            processed_reviews.append(processed_review)
-        
-        return processed_reviews
+            yield processed_review
         
     except Exception as e:
         print(f"Error crawling Google Play reviews: {str(e)}", file=sys.stderr)
-        return []
 
 def crawl_apple_store(app_id, count=100, start_date=None, end_date=None):
     """